@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import abc
-from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
+import io
+import itertools
+import operator
+import os
 from typing import Any, final, Optional, TypeVar
 
 import numpy as np
@@ -25,6 +28,119 @@ from explainaboard.metrics.metric import (
 from explainaboard.serialization.serializers import PrimitiveSerializer
 from explainaboard.utils.typing_utils import narrow, unwrap
 
+# Whether analysis results validate their contents on construction. Validation can be
+# disabled by setting EXPLAINABOARD_VALIDATE=0 to save time when constructing many
+# results from trusted data.
+_VALIDATE = os.environ.get('EXPLAINABOARD_VALIDATE', '1') != '0'
+
+# Result of a metric over a bucket without any samples.
+_EMPTY_METRIC_RESULT = MetricResult({})
+
+# Bucketing functions that can be specified by `BucketAnalysis.method`.
+_BUCKET_METHODS: dict[str, Callable[..., list[AnalysisCaseCollection]]] = {
+    'continuous': explainaboard.analysis.bucketing.continuous,
+    'discrete': explainaboard.analysis.bucketing.discrete,
+    'fixed': explainaboard.analysis.bucketing.fixed,
+}
+
+
+def _extract_feature_column(
+    cases: list[AnalysisCase], feature: str, numeric: bool = True
+) -> np.ndarray:
+    """Gathers the values of a feature over all cases into a single array.
+
+    Args:
+        cases: The analysis cases holding the feature.
+        feature: The name of the feature.
+        numeric: Whether numeric features are stored with a numeric dtype. This
+          converts the values, e.g., ints become floats if the feature also has float
+          values, so it should be disabled when the values themselves are used.
+
+    Returns:
+        A 1-dimensional array with the feature value of each case. If `numeric` is set,
+        numeric features are stored with a numeric dtype. Other features are stored as
+        an object array holding the original values.
+    """
+    values = [case.features[feature] for case in cases]
+    if numeric:
+        try:
+            column = np.asarray(values)
+        except ValueError:
+            # Sequences of different lengths can not be stacked into an array.
+            pass
+        else:
+            if column.ndim == 1 and column.dtype.kind in "biuf":
+                return column
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _concatenate_bucket_samples(
+    bucket_collections: list[AnalysisCaseCollection],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Concatenates the sample IDs of all buckets into a single index array.
+
+    Gathering statistics with the returned indices once lets every bucket take a
+    contiguous slice, instead of filtering the statistics bucket by bucket and metric
+    by metric.
+
+    Args:
+        bucket_collections: The buckets to process.
+
+    Returns:
+        Tuple of following values:
+            - The sample IDs of all buckets, ordered bucket by bucket.
+            - The boundaries of the buckets: the sample IDs of the i-th bucket are
+              located in `[bounds[i], bounds[i + 1])` of the first value.
+    """
+    num_buckets = len(bucket_collections)
+    bounds = np.zeros(num_buckets + 1, dtype=np.intp)
+    np.cumsum(
+        np.fromiter(
+            (len(x.samples) for x in bucket_collections),
+            dtype=np.intp,
+            count=num_buckets,
+        ),
+        out=bounds[1:],
+    )
+    sample_ids = np.fromiter(
+        itertools.chain.from_iterable(x.samples for x in bucket_collections),
+        dtype=np.intp,
+        count=int(bounds[-1]),
+    )
+    return sample_ids, bounds
+
+
+def _write_bucket_report(
+    buf: io.StringIO, name: str, bucket_performances: list[BucketPerformance]
+) -> None:
+    """Writes the bucket-by-bucket performance tables of all metrics.
+
+    Each table is followed by an empty line.
+
+    Args:
+        buf: The buffer to write the report.
+        name: The name of the analysis result.
+        bucket_performances: The performances to report.
+    """
+    bucket_names = [
+        f"{unwrap(x.bucket_interval)}"
+        if x.bucket_interval is not None
+        else unwrap(x.bucket_name)
+        for x in bucket_performances
+    ]
+
+    for metric_name in sorted(bucket_performances[0].results):
+        buf.write(f"the information of #{name}#\n")
+        buf.write(f"bucket_name\t{metric_name}\t#samples\n")
+
+        for bucket_name, bucket_perf in zip(bucket_names, bucket_performances):
+            metric_value = bucket_perf.results[metric_name].get_value(Score, "score")
+            buf.write(f"{bucket_name}\t{metric_value.value}\t{bucket_perf.n_samples}\n")
+
+        buf.write("\n")
+
 
 @dataclass
 class AnalysisResult(metaclass=abc.ABCMeta):
@@ -52,15 +168,11 @@ class AnalysisResult(metaclass=abc.ABCMeta):
     @staticmethod
     def from_dict(dikt):
         """Deserialization method."""
-        type = dikt.pop('cls_name')
-        if type == 'BucketAnalysisResult':
-            return BucketAnalysisResult.from_dict(dikt)
-        elif type == 'ComboCountAnalysisResult':
-            return ComboCountAnalysisResult.from_dict(dikt)
-        elif type == 'CalibrationAnalysisResult':
-            return CalibrationAnalysisResult.from_dict(dikt)
-        else:
+        type = dikt['cls_name']
+        result_type = _ANALYSIS_RESULT_TYPES.get(type)
+        if result_type is None:
             raise ValueError(f'bad AnalysisResult type {type}')
+        return result_type.from_dict(dikt)
 
 
 @dataclass
@@ -106,31 +218,11 @@ class Analysis(metaclass=abc.ABCMeta):
     @staticmethod
     def from_dict(dikt: dict):
         """Deserialization method."""
-        type = dikt.pop('cls_name')
-        if type == 'BucketAnalysis':
-            return BucketAnalysis(
-                description=dikt.get('description'),
-                level=dikt['level'],
-                feature=dikt['feature'],
-                method=dikt.get('method', 'continuous'),
-                num_buckets=dikt.get('num_buckets', 4),
-                setting=dikt.get('setting'),
-                sample_limit=dikt.get('sample_limit', 50),
-            )
-        elif type == 'ComboCountAnalysis':
-            return ComboCountAnalysis(
-                description=dikt.get('description'),
-                level=dikt['level'],
-                features=tuple(dikt['features']),
-            )
-        elif type == 'CalibrationAnalysis':
-            return CalibrationAnalysis(
-                description=dikt.get('description'),
-                level=dikt['level'],
-                feature=dikt['feature'],
-                num_buckets=dikt.get('num_buckets', 10),
-                sample_limit=dikt.get('sample_limit', 50),
-            )
+        type = dikt['cls_name']
+        from_dict = _ANALYSIS_FROM_DICT.get(type)
+        if from_dict is None:
+            raise ValueError(f'bad Analysis type {type}')
+        return from_dict(dikt)
 
     @final
     @staticmethod
@@ -146,12 +238,14 @@ class Analysis(metaclass=abc.ABCMeta):
         Returns:
             Subsampled list of sample IDs
         """
-        if len(analysis_cases) > sample_limit:
-            sample_ids = np.random.choice(analysis_cases, sample_limit, replace=False)
-            return sample_ids.tolist()
-        else:
+        if len(analysis_cases) <= sample_limit:
             return analysis_cases
 
+        # Sample positions rather than the IDs themselves to avoid converting the
+        # whole list into an array.
+        positions = np.random.choice(len(analysis_cases), sample_limit, replace=False)
+        return [analysis_cases[i] for i in positions]
+
 
 @final
 @dataclass
@@ -182,44 +276,25 @@ class BucketAnalysisResult(AnalysisResult):
 
     def __post_init__(self):
         """Set the class name and validate."""
-        metric_names = self.bucket_performances[0].results.keys()
+        if _VALIDATE:
+            metric_names = self.bucket_performances[0].results.keys()
 
-        for bucket_perf in self.bucket_performances:
-            if bucket_perf.results.keys() != metric_names:
-                raise ValueError(
-                    "Inconsistent metrics. "
-                    f"Required: {set(metric_names)}, "
-                    f"got: {set(bucket_perf.results.keys())}"
-                )
+            for bucket_perf in self.bucket_performances:
+                if bucket_perf.results.keys() != metric_names:
+                    raise ValueError(
+                        "Inconsistent metrics. "
+                        f"Required: {set(metric_names)}, "
+                        f"got: {set(bucket_perf.results.keys())}"
+                    )
 
         self.cls_name: str = self.__class__.__name__
 
     def generate_report(self) -> str:
         """See AnalysisResult.generate_report."""
-        texts: list[str] = []
-
-        metric_names = sorted(k for k in self.bucket_performances[0].results)
-
-        for metric_name in metric_names:
-            texts.append(f"the information of #{self.name}#")
-            texts.append(f"bucket_name\t{metric_name}\t#samples")
-
-            for bucket_perf in self.bucket_performances:
-                metric_result = bucket_perf.results[metric_name]
-                metric_value = metric_result.get_value(Score, "score").value
-
-                if bucket_perf.bucket_interval is not None:
-                    bucket_name = f"{unwrap(bucket_perf.bucket_interval)}"
-                else:
-                    bucket_name = unwrap(bucket_perf.bucket_name)
-
-                texts.append(
-                    f"{bucket_name}\t" f"{metric_value}\t" f"{bucket_perf.n_samples}"
-                )
-
-            texts.append('')
-
-        return "\n".join(texts)
+        buf = io.StringIO()
+        _write_bucket_report(buf, self.name, self.bucket_performances)
+        # Drop the empty line after the last table.
+        return buf.getvalue()[:-1]
 
 
 @final
@@ -248,9 +323,25 @@ class BucketAnalysis(Analysis):
     cls_name: Optional[str] = None
 
     def __post_init__(self):
-        """Set the class name."""
+        """Set the class name and validate."""
+        if self.method not in _BUCKET_METHODS:
+            raise ValueError(f"Invalid bucketing method: {self.method}")
+
         self.cls_name: str = self.__class__.__name__
 
+    @staticmethod
+    def _from_dict(dikt: dict) -> BucketAnalysis:
+        """Deserialization method called by Analysis.from_dict."""
+        return BucketAnalysis(
+            description=dikt.get('description'),
+            level=dikt['level'],
+            feature=dikt['feature'],
+            method=dikt.get('method', 'continuous'),
+            num_buckets=dikt.get('num_buckets', 4),
+            setting=dikt.get('setting'),
+            sample_limit=dikt.get('sample_limit', 50),
+        )
+
     AnalysisCaseType = TypeVar('AnalysisCaseType')
 
     def perform(
@@ -262,22 +353,30 @@ class BucketAnalysis(Analysis):
     ) -> AnalysisResult:
         """See Analysis.perform."""
         # Preparation for bucketing
-        bucket_func: Callable[..., list[AnalysisCaseCollection]] = getattr(
-            explainaboard.analysis.bucketing,
-            self.method,
-        )
+        bucket_func = _BUCKET_METHODS[self.method]
 
         if len(cases) == 0 or self.feature not in cases[0].features:
             raise RuntimeError(f"bucket analysis: feature {self.feature} not found.")
 
+        # Discrete buckets are named after the feature values, so they take the
+        # values as they are.
+        feature_values = _extract_feature_column(
+            cases, self.feature, numeric=self.method != 'discrete'
+        )
         samples_over_bucket = bucket_func(
-            sample_features=[(x, x.features[self.feature]) for x in cases],
+            feature_values=feature_values,
             bucket_number=self.num_buckets,
             bucket_setting=self.setting,
         )
 
+        sample_ids, bounds = _concatenate_bucket_samples(samples_over_bucket)
+        bucket_ordered_data = {
+            metric_name: stats[metric_name].filter(sample_ids).get_data()
+            for metric_name in metrics
+        }
+
         bucket_performances: list[BucketPerformance] = []
-        for bucket_collection in samples_over_bucket:
+        for i, bucket_collection in enumerate(samples_over_bucket):
             # Subsample examples to save
             subsampled_ids = self._subsample_analysis_cases(
                 self.sample_limit, bucket_collection.samples
@@ -285,21 +384,19 @@ class BucketAnalysis(Analysis):
 
             n_samples = len(bucket_collection.samples)
 
-            results: dict[str, MetricResult] = {}
-
-            for metric_name, metric_func in metrics.items():
-                metric_stat = stats[metric_name]
-
-                # Samples may be empty when user defined a bucket interval that
-                # has no samples
-                if n_samples == 0.0:
-                    results[metric_name] = MetricResult({})
-                else:
-                    bucket_stats = metric_stat.filter(bucket_collection.samples)
-                    results[metric_name] = metric_func.evaluate_from_stats(
-                        bucket_stats,
+            # Samples may be empty when user defined a bucket interval that
+            # has no samples
+            if n_samples == 0:
+                results = {metric_name: _EMPTY_METRIC_RESULT for metric_name in metrics}
+            else:
+                begin, end = bounds[i], bounds[i + 1]
+                results = {
+                    metric_name: metric_func.evaluate_from_stats(
+                        SimpleMetricStats(bucket_ordered_data[metric_name][begin:end]),
                         confidence_alpha=confidence_alpha,
                     )
+                    for metric_name, metric_func in metrics.items()
+                }
 
             bucket_performances.append(
                 BucketPerformance(
@@ -358,47 +455,30 @@ class CalibrationAnalysisResult(AnalysisResult):
 
     def __post_init__(self):
         """Set the class name and validate."""
-        for bucket_perf in self.bucket_performances:
-            metric_result = bucket_perf.results.get("Accuracy", None)
-            if metric_result is None:
-                raise ValueError(
-                    "Wrong metrics. "
-                    "Required: Accuracy, "
-                    f"got: {set(bucket_perf.results.keys())}"
-                )
-            confidence = metric_result.get_value_or_none(Score, "confidence")
-            if confidence is None:
-                raise ValueError("MetricResult does not have the \"confidence\" score.")
+        if _VALIDATE:
+            for bucket_perf in self.bucket_performances:
+                metric_result = bucket_perf.results.get("Accuracy", None)
+                if metric_result is None:
+                    raise ValueError(
+                        "Wrong metrics. "
+                        "Required: Accuracy, "
+                        f"got: {set(bucket_perf.results.keys())}"
+                    )
+                confidence = metric_result.get_value_or_none(Score, "confidence")
+                if confidence is None:
+                    raise ValueError(
+                        "MetricResult does not have the \"confidence\" score."
+                    )
 
         self.cls_name: str = self.__class__.__name__
 
     def generate_report(self) -> str:
         """See AnalysisResult.generate_report."""
-        texts: list[str] = []
-
-        metric_names = sorted(self.bucket_performances[0].results.keys())
-
-        for metric_name in metric_names:
-            texts.append(f"the information of #{self.name}#")
-            texts.append(f"bucket_name\t{metric_name}\t#samples")
-
-            for bucket_perf in self.bucket_performances:
-                metric_result = bucket_perf.results[metric_name]
-                score = metric_result.get_value(Score, "score").value
-
-                if bucket_perf.bucket_interval is not None:
-                    bucket_name = f"{unwrap(bucket_perf.bucket_interval)}"
-                else:
-                    bucket_name = unwrap(bucket_perf.bucket_name)
-
-                texts.append(f"{bucket_name}\t" f"{score}\t" f"{bucket_perf.n_samples}")
-
-            texts.append('')
-
-        texts.append(f"expected_calibration_error\t{self.expected_calibration_error}")
-        texts.append(f"maximum_calibration_error\t{self.maximum_calibration_error}")
-        texts.append('')
-        return "\n".join(texts)
+        buf = io.StringIO()
+        _write_bucket_report(buf, self.name, self.bucket_performances)
+        buf.write(f"expected_calibration_error\t{self.expected_calibration_error}\n")
+        buf.write(f"maximum_calibration_error\t{self.maximum_calibration_error}\n")
+        return buf.getvalue()
 
 
 @final
@@ -427,6 +507,17 @@ class CalibrationAnalysis(Analysis):
         if self.num_buckets <= 0:
             raise ValueError(f"Invalid num_buckets: {self.num_buckets}")
 
+    @staticmethod
+    def _from_dict(dikt: dict) -> CalibrationAnalysis:
+        """Deserialization method called by Analysis.from_dict."""
+        return CalibrationAnalysis(
+            description=dikt.get('description'),
+            level=dikt['level'],
+            feature=dikt['feature'],
+            num_buckets=dikt.get('num_buckets', 10),
+            sample_limit=dikt.get('sample_limit', 50),
+        )
+
     AnalysisCaseType = TypeVar('AnalysisCaseType')
 
     def _perform_calibration_analysis(
@@ -442,17 +533,31 @@ class CalibrationAnalysis(Analysis):
                 - The expected calibration error.
                 - The maximul calibration error.
         """
-        total_error, total_size = 0.0, 0
-        mce = 0.0
-        for bucket_performance in bucket_performances:
-            metric_result = bucket_performance.results.get("Accuracy", MetricResult({}))
-            bucket_accuracy = metric_result.get_value(Score, "score").value
-            bucket_confidence = metric_result.get_value(Score, "confidence").value
-            bucket_size = bucket_performance.n_samples
-            total_error += bucket_size * abs(bucket_accuracy - bucket_confidence)
-            total_size += bucket_size
-            mce = max(mce, abs(bucket_accuracy - bucket_confidence))
-        ece = (total_error / total_size) if total_size > 0 else 0.0
+        num_buckets = len(bucket_performances)
+        metric_results = [
+            bucket_performance.results.get("Accuracy", _EMPTY_METRIC_RESULT)
+            for bucket_performance in bucket_performances
+        ]
+        accuracies = np.fromiter(
+            (x.get_value(Score, "score").value for x in metric_results),
+            dtype=np.float64,
+            count=num_buckets,
+        )
+        confidences = np.fromiter(
+            (x.get_value(Score, "confidence").value for x in metric_results),
+            dtype=np.float64,
+            count=num_buckets,
+        )
+        sizes = np.fromiter(
+            (x.n_samples for x in bucket_performances),
+            dtype=np.int64,
+            count=num_buckets,
+        )
+
+        errors = np.abs(accuracies - confidences)
+        total_size = sizes.sum()
+        ece = float(np.dot(sizes, errors) / total_size) if total_size > 0 else 0.0
+        mce = float(errors.max()) if num_buckets > 0 else 0.0
         return ece, mce
 
     def perform(
@@ -473,37 +578,40 @@ class CalibrationAnalysis(Analysis):
         if not acc_metric or not metric_stat:
             raise RuntimeError("calibration analysis: metric Accuracy not found.")
 
-        # Get confidence metric stats
-        acc_data = metric_stat.get_data()
-        conf_data = np.expand_dims(
-            np.array([float(case.features.get(self.feature, 0.0)) for case in cases]), 1
+        # Get confidence metric stats. The confidences are used for bucketing as well,
+        # so they are gathered in a single pass over the cases.
+        confidences = np.fromiter(
+            (float(case.features[self.feature]) for case in cases),
+            dtype=np.float64,
+            count=len(cases),
         )
+        acc_data = metric_stat.get_data()
+        conf_data = confidences[:, np.newaxis]
         assert acc_data.shape == conf_data.shape
         conf_metric_stat = SimpleMetricStats(conf_data)
 
-        # Preparation for bucketing
-        bucket_func: Callable[..., list[AnalysisCaseCollection]] = getattr(
-            explainaboard.analysis.bucketing,
-            "fixed",
-        )
-
-        bucket_setting = [
-            (
-                (float(i) / self.num_buckets, float(i + 1) / self.num_buckets)
-                if i < self.num_buckets - 1
-                else (float(i) / self.num_buckets, 1.0)
+        # Bucketing over equal-width intervals of [0, 1]. A confidence on the boundary
+        # of two intervals belongs to the lower one, and confidences out of [0, 1] are
+        # not assigned to any bucket.
+        edges = np.arange(self.num_buckets + 1) / self.num_buckets
+        in_range = np.flatnonzero((confidences >= 0.0) & (confidences <= 1.0))
+        bucket_ids = np.searchsorted(edges[1:-1], confidences[in_range], side="left")
+        sample_ids = in_range[np.argsort(bucket_ids, kind="stable")]
+        bounds = np.zeros(self.num_buckets + 1, dtype=np.intp)
+        np.cumsum(np.bincount(bucket_ids, minlength=self.num_buckets), out=bounds[1:])
+        samples_over_bucket = [
+            AnalysisCaseCollection(
+                samples=sample_ids[bounds[i] : bounds[i + 1]].tolist(),
+                interval=(float(edges[i]), float(edges[i + 1])),
             )
             for i in range(self.num_buckets)
         ]
 
-        samples_over_bucket = bucket_func(
-            sample_features=[(x, x.features[self.feature]) for x in cases],
-            bucket_number=self.num_buckets,
-            bucket_setting=bucket_setting,
-        )
+        bucket_ordered_acc_data = metric_stat.filter(sample_ids).get_data()
+        bucket_ordered_conf_data = conf_metric_stat.filter(sample_ids).get_data()
 
         bucket_performances: list[BucketPerformance] = []
-        for bucket_collection in samples_over_bucket:
+        for i, bucket_collection in enumerate(samples_over_bucket):
             # Subsample examples to save
             subsampled_ids = self._subsample_analysis_cases(
                 self.sample_limit, bucket_collection.samples
@@ -513,11 +621,14 @@ class CalibrationAnalysis(Analysis):
 
             # Samples may be empty when user defined a bucket interval that
             # has no samples
-            if n_samples == 0.0:
-                metric_result = MetricResult({})
+            if n_samples == 0:
+                metric_result = _EMPTY_METRIC_RESULT
             else:
-                bucket_stats = metric_stat.filter(bucket_collection.samples)
-                bucket_conf_stats = conf_metric_stat.filter(bucket_collection.samples)
+                begin, end = bounds[i], bounds[i + 1]
+                bucket_stats = SimpleMetricStats(bucket_ordered_acc_data[begin:end])
+                bucket_conf_stats = SimpleMetricStats(
+                    bucket_ordered_conf_data[begin:end]
+                )
                 metric_result = acc_metric.evaluate_from_stats(
                     bucket_stats,
                     confidence_alpha=confidence_alpha,
@@ -556,10 +667,22 @@ class ComboOccurence:
             efficiency, so `len(sample_ids) <= sample_count`.
     """
 
+    # Slots are declared by hand since `dataclass(slots=True)` requires Python 3.10.
+    __slots__ = ('features', 'sample_count', 'sample_ids')
+
     features: tuple[str, ...]
     sample_count: int
     sample_ids: list[int]
 
+    def __getstate__(self) -> tuple[tuple[str, ...], int, list[int]]:
+        """Return the state for pickling, as frozen slots have no `__dict__`."""
+        return self.features, self.sample_count, self.sample_ids
+
+    def __setstate__(self, state: tuple[tuple[str, ...], int, list[int]]) -> None:
+        """Restore the state through object.__setattr__ to bypass the frozen check."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
     @staticmethod
     def from_dict(dikt: dict) -> ComboOccurence:
         """Deserialization method."""
@@ -617,16 +740,18 @@ class ComboCountAnalysisResult(AnalysisResult):
 
     def generate_report(self) -> str:
         """See AnalysisResult.generate_report."""
-        texts: list[str] = []
-
-        texts.append('feature combos for ' + ', '.join(self.features))
-        texts.append('\t'.join(self.features + ('#',)))
+        buf = io.StringIO()
+        buf.write('feature combos for ' + ', '.join(self.features) + '\n')
+        buf.write('\t'.join(self.features + ('#',)) + '\n')
 
-        for occ in sorted(self.combo_occurrences):
-            texts.append('\t'.join(occ.features + (str(occ.sample_count),)))
+        # Same order as ComboOccurence.__lt__, but the keys are built once per
+        # occurrence instead of once per comparison.
+        for occ in sorted(
+            self.combo_occurrences, key=operator.attrgetter('features', 'sample_count')
+        ):
+            buf.write('\t'.join(occ.features + (str(occ.sample_count),)) + '\n')
 
-        texts.append('')
-        return "\n".join(texts)
+        return buf.getvalue()
 
 
 @final
@@ -654,6 +779,15 @@ class ComboCountAnalysis(Analysis):
         """Set the class name."""
         self.cls_name: str = self.__class__.__name__
 
+    @staticmethod
+    def _from_dict(dikt: dict) -> ComboCountAnalysis:
+        """Deserialization method called by Analysis.from_dict."""
+        return ComboCountAnalysis(
+            description=dikt.get('description'),
+            level=dikt['level'],
+            features=tuple(dikt['features']),
+        )
+
     AnalysisCaseType = TypeVar('AnalysisCaseType')
 
     def perform(
@@ -668,17 +802,57 @@ class ComboCountAnalysis(Analysis):
             if x not in cases[0].features:
                 raise RuntimeError(f"combo analysis: feature {x} not found.")
 
-        combo_map: defaultdict[tuple[str, ...], list[int]] = defaultdict(list)
-        for case in cases:
-            feat_vals = tuple([case.features[x] for x in self.features])
-            combo_map[feat_vals].append(case.sample_id)
+        num_cases = len(cases)
+        sample_ids = np.fromiter(
+            (case.sample_id for case in cases), dtype=np.int64, count=num_cases
+        )
 
-        combo_list = [
-            ComboOccurence(
-                k, len(v), self._subsample_analysis_cases(self.sample_limit, v)
+        # Factorize each feature column and fold the codes into a single combo ID per
+        # case, so that cases are grouped without hashing a tuple per case. Values are
+        # interned with dict.setdefault(), which only requires them to be hashable.
+        combo_ids = np.zeros(num_cases, dtype=np.int64)
+        for feature in self.features:
+            value_ids: dict[Any, int] = {}
+            codes = np.fromiter(
+                (
+                    value_ids.setdefault(case.features[feature], len(value_ids))
+                    for case in cases
+                ),
+                dtype=np.int64,
+                count=num_cases,
             )
-            for k, v in combo_map.items()
+            combo_ids = combo_ids * len(value_ids) + codes
+            if len(self.features) > 2:
+                # Keep the IDs dense so that folding in more features never overflows.
+                _, combo_ids = np.unique(combo_ids, return_inverse=True)
+                combo_ids = combo_ids.reshape(-1)
+
+        # Sort cases by combo ID so that each combo owns a contiguous slice.
+        order = np.argsort(combo_ids, kind='stable')
+        sorted_combo_ids = combo_ids[order]
+        bounds: np.ndarray = np.r_[
+            0,
+            np.flatnonzero(sorted_combo_ids[1:] != sorted_combo_ids[:-1]) + 1,
+            num_cases,
         ]
+        sorted_sample_ids = sample_ids[order]
+
+        # Emit combos in order of their first appearance in `cases`. Since the sort is
+        # stable, the first case of each slice is the earliest case of that combo.
+        begins, ends = bounds[:-1], bounds[1:]
+        first_appearance = np.argsort(order[begins], kind='stable')
+
+        combo_list: list[ComboOccurence] = []
+        for begin, end in zip(begins[first_appearance], ends[first_appearance]):
+            representative = cases[order[begin]]
+            combo_sample_ids = sorted_sample_ids[begin:end].tolist()
+            combo_list.append(
+                ComboOccurence(
+                    tuple(representative.features[x] for x in self.features),
+                    int(end - begin),
+                    self._subsample_analysis_cases(self.sample_limit, combo_sample_ids),
+                )
+            )
 
         return ComboCountAnalysisResult(
             name='combo(' + ','.join(self.features) + ')',
@@ -724,3 +898,16 @@ class AnalysisLevel:
             features=features,
             metric_configs=metric_configs,
         )
+
+
+# Deserializers of each AnalysisResult and Analysis, keyed by `cls_name`.
+_ANALYSIS_RESULT_TYPES: dict[str, type[AnalysisResult]] = {
+    'BucketAnalysisResult': BucketAnalysisResult,
+    'ComboCountAnalysisResult': ComboCountAnalysisResult,
+    'CalibrationAnalysisResult': CalibrationAnalysisResult,
+}
+_ANALYSIS_FROM_DICT: dict[str, Callable[[dict], Analysis]] = {
+    'BucketAnalysis': BucketAnalysis._from_dict,
+    'ComboCountAnalysis': ComboCountAnalysis._from_dict,
+    'CalibrationAnalysis': CalibrationAnalysis._from_dict,
+}
@@ -1,16 +1,93 @@
 """Tests for explainaboard.analysis.analyses."""
 
+from __future__ import annotations
+
+import copy
+import pickle
 import textwrap
 import unittest
+from unittest.mock import patch
+
+import numpy as np
 
 from explainaboard.analysis.analyses import (
+    _extract_feature_column,
+    Analysis,
+    BucketAnalysis,
     BucketAnalysisResult,
+    CalibrationAnalysis,
     CalibrationAnalysisResult,
+    ComboCountAnalysis,
     ComboCountAnalysisResult,
     ComboOccurence,
 )
+from explainaboard.analysis.case import AnalysisCase
 from explainaboard.analysis.performance import BucketPerformance
-from explainaboard.metrics.metric import MetricResult, Score
+from explainaboard.metrics.accuracy import AccuracyConfig
+from explainaboard.metrics.metric import MetricResult, Score, SimpleMetricStats
+from explainaboard.utils.typing_utils import narrow
+
+
+class AnalysisTest(unittest.TestCase):
+    def test_from_dict(self) -> None:
+        dikt = {
+            "cls_name": "ComboCountAnalysis",
+            "description": "foo",
+            "level": "example",
+            "features": ["a", "b"],
+        }
+        self.assertEqual(
+            Analysis.from_dict(dikt),
+            ComboCountAnalysis(description="foo", level="example", features=("a", "b")),
+        )
+        # The input is not modified.
+        self.assertEqual(dikt["cls_name"], "ComboCountAnalysis")
+
+    def test_from_dict_unknown_type(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"^bad Analysis type Foo"):
+            Analysis.from_dict({"cls_name": "Foo", "level": "example"})
+
+    def test_subsample_analysis_cases_under_limit(self) -> None:
+        sample_ids = [3, 1, 4]
+        self.assertIs(Analysis._subsample_analysis_cases(3, sample_ids), sample_ids)
+
+    def test_subsample_analysis_cases_over_limit(self) -> None:
+        sample_ids = list(range(100, 200))
+        np.random.seed(12345)
+        subsampled = Analysis._subsample_analysis_cases(10, sample_ids)
+        self.assertEqual(len(subsampled), 10)
+        self.assertEqual(len(set(subsampled)), 10)
+        self.assertTrue(set(subsampled) <= set(sample_ids))
+        np.random.seed(12345)
+        self.assertEqual(subsampled, Analysis._subsample_analysis_cases(10, sample_ids))
+
+
+class ExtractFeatureColumnTest(unittest.TestCase):
+    def _cases(self, values: list) -> list[AnalysisCase]:
+        return [
+            AnalysisCase(sample_id=i, features={"x": x}) for i, x in enumerate(values)
+        ]
+
+    def test_numpy_scalars(self) -> None:
+        column = _extract_feature_column(self._cases([np.int64(2), np.int64(1)]), "x")
+        self.assertEqual(column.dtype.kind, "i")
+        np.testing.assert_array_equal(column, [2, 1])
+
+    def test_mixed_int_and_float(self) -> None:
+        cases = self._cases([1, 2.5])
+        self.assertEqual(_extract_feature_column(cases, "x").dtype.kind, "f")
+        column = _extract_feature_column(cases, "x", numeric=False)
+        self.assertEqual(column.dtype, object)
+        self.assertIs(type(column[0]), int)
+
+    def test_non_numeric(self) -> None:
+        all_values: list[list] = [["a", "b"], [[1], [2, 3]], [[1, 2], [3, 4]]]
+        for values in all_values:
+            with self.subTest(values=values):
+                column = _extract_feature_column(self._cases(values), "x")
+                self.assertEqual(column.dtype, object)
+                self.assertEqual(column.shape, (2,))
+                self.assertEqual(column.tolist(), values)
 
 
 class BucketAnalysisResultTest(unittest.TestCase):
@@ -40,6 +117,28 @@ class BucketAnalysisResultTest(unittest.TestCase):
                 ],
             )
 
+    def test_inconsistent_metrics_without_validation(self) -> None:
+        with patch("explainaboard.analysis.analyses._VALIDATE", False):
+            result = BucketAnalysisResult(
+                name="foo",
+                level="bar",
+                bucket_performances=[
+                    BucketPerformance(
+                        n_samples=5,
+                        bucket_samples=[0, 1, 2, 3, 4],
+                        results={"metric1": MetricResult({"score": Score(0.5)})},
+                        bucket_name="baz",
+                    ),
+                    BucketPerformance(
+                        n_samples=5,
+                        bucket_samples=[5, 6, 7, 8, 9],
+                        results={"metric2": MetricResult({"score": Score(0.125)})},
+                        bucket_name="qux",
+                    ),
+                ],
+            )
+        self.assertEqual(result.cls_name, "BucketAnalysisResult")
+
     def test_inconsistent_metric_names(self) -> None:
         with self.assertRaisesRegex(ValueError, r"^Inconsistent metrics"):
             BucketAnalysisResult(
@@ -148,6 +247,67 @@ class BucketAnalysisResultTest(unittest.TestCase):
         self.assertEqual(result.generate_report(), report)
 
 
+class BucketAnalysisTest(unittest.TestCase):
+    def test_invalid_method(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"^Invalid bucketing method: foo$"):
+            BucketAnalysis(
+                description="foo", level="example", feature="label", method="foo"
+            )
+
+    def test_perform_with_empty_bucket(self) -> None:
+        cases = [
+            AnalysisCase(sample_id=i, features={"label": x})
+            for i, x in enumerate(["a", "b", "a", "a"])
+        ]
+        analysis = BucketAnalysis(
+            description="foo",
+            level="example",
+            feature="label",
+            method="fixed",
+            setting=["a", "b", "c"],
+        )
+        result = analysis.perform(
+            cases=cases,
+            metrics={"Accuracy": AccuracyConfig().to_metric()},
+            stats={"Accuracy": SimpleMetricStats(np.array([1.0, 0.0, 0.0, 1.0]))},
+            confidence_alpha=0.05,
+        )
+        result = narrow(BucketAnalysisResult, result)
+        buckets = result.bucket_performances
+        self.assertEqual([x.bucket_name for x in buckets], ["a", "b", "c"])
+        self.assertEqual([x.n_samples for x in buckets], [3, 1, 0])
+        self.assertAlmostEqual(
+            buckets[0].results["Accuracy"].get_value(Score, "score").value, 2 / 3
+        )
+        self.assertEqual(
+            buckets[1].results["Accuracy"].get_value(Score, "score").value, 0.0
+        )
+        self.assertIsNone(
+            buckets[2].results["Accuracy"].get_value_or_none(Score, "score")
+        )
+
+    def test_perform_discrete_keeps_values(self) -> None:
+        cases = [
+            AnalysisCase(sample_id=i, features={"x": x})
+            for i, x in enumerate([1, 2.5, 1])
+        ]
+        analysis = BucketAnalysis(
+            description="foo", level="example", feature="x", method="discrete"
+        )
+        result = narrow(
+            BucketAnalysisResult,
+            analysis.perform(
+                cases=cases,
+                metrics={"Accuracy": AccuracyConfig().to_metric()},
+                stats={"Accuracy": SimpleMetricStats(np.array([1.0, 0.0, 1.0]))},
+                confidence_alpha=0.05,
+            ),
+        )
+        names = [x.bucket_name for x in result.bucket_performances]
+        self.assertEqual(names, [1, 2.5])
+        self.assertIs(type(names[0]), int)
+
+
 class ComboCountAnalysisResultTest(unittest.TestCase):
     def test_inconsistent_feature(self) -> None:
         with self.assertRaisesRegex(ValueError, r"^Inconsistent number of features"):
@@ -181,6 +341,77 @@ class ComboCountAnalysisResultTest(unittest.TestCase):
         self.assertEqual(result.generate_report(), report)
 
 
+class ComboOccurenceTest(unittest.TestCase):
+    def test_copy(self) -> None:
+        occurence = ComboOccurence(("a", "b"), 2, [0, 3])
+        self.assertFalse(hasattr(occurence, "__dict__"))
+        self.assertEqual(copy.deepcopy(occurence), occurence)
+        self.assertEqual(pickle.loads(pickle.dumps(occurence)), occurence)
+
+
+class ComboCountAnalysisTest(unittest.TestCase):
+    def test_perform(self) -> None:
+        labels = [("a", "a"), ("a", "b"), ("b", "b"), ("a", "a"), ("b", "b")]
+        cases = [
+            AnalysisCase(sample_id=i, features={"true": t, "pred": p})
+            for i, (t, p) in enumerate(labels)
+        ]
+        analysis = ComboCountAnalysis(
+            description="foo", level="example", features=("true", "pred")
+        )
+        result = analysis.perform(
+            cases=cases, metrics={}, stats={}, confidence_alpha=0.05
+        )
+        result = narrow(ComboCountAnalysisResult, result)
+        self.assertEqual(
+            sorted(result.combo_occurrences),
+            [
+                ComboOccurence(("a", "a"), 2, [0, 3]),
+                ComboOccurence(("a", "b"), 1, [1]),
+                ComboOccurence(("b", "b"), 2, [2, 4]),
+            ],
+        )
+
+    def test_perform_keeps_order_of_appearance(self) -> None:
+        labels = [("b", "a"), ("a", "b"), ("b", "b"), ("a", "a")]
+        cases = [
+            AnalysisCase(sample_id=i, features={"true": t, "pred": p})
+            for i, (t, p) in enumerate(labels)
+        ]
+        analysis = ComboCountAnalysis(
+            description="foo", level="example", features=("true", "pred")
+        )
+        result = narrow(
+            ComboCountAnalysisResult,
+            analysis.perform(cases=cases, metrics={}, stats={}, confidence_alpha=0.05),
+        )
+        self.assertEqual(
+            [occ.features for occ in result.combo_occurrences],
+            [("b", "a"), ("a", "b"), ("b", "b"), ("a", "a")],
+        )
+
+    def test_perform_unorderable_values(self) -> None:
+        labels = [("a", None), (None, "a"), ("a", None)]
+        cases = [
+            AnalysisCase(sample_id=i, features={"true": t, "pred": p})
+            for i, (t, p) in enumerate(labels)
+        ]
+        analysis = ComboCountAnalysis(
+            description="foo", level="example", features=("true", "pred")
+        )
+        result = narrow(
+            ComboCountAnalysisResult,
+            analysis.perform(cases=cases, metrics={}, stats={}, confidence_alpha=0.05),
+        )
+        self.assertEqual(
+            [
+                (occ.features, occ.sample_count, occ.sample_ids)
+                for occ in result.combo_occurrences
+            ],
+            [(("a", None), 2, [0, 2]), ((None, "a"), 1, [1])],
+        )
+
+
 class CalibrationAnalysisResultTest(unittest.TestCase):
     def test_missing_accuracy_metric(self) -> None:
         with self.assertRaisesRegex(ValueError, r"^Wrong metrics"):
@@ -281,3 +512,63 @@ class CalibrationAnalysisResultTest(unittest.TestCase):
             """
         )
         self.assertEqual(result.generate_report(), report)
+
+
+class CalibrationAnalysisTest(unittest.TestCase):
+    def test_perform_calibration_analysis(self) -> None:
+        analysis = CalibrationAnalysis(
+            description="foo", level="example", feature="confidence"
+        )
+        bucket_performances = [
+            BucketPerformance(
+                n_samples=n,
+                bucket_samples=[],
+                results={
+                    "Accuracy": MetricResult(
+                        {"score": Score(acc), "confidence": Score(conf)}
+                    ),
+                },
+                bucket_interval=(0.0, 1.0),
+            )
+            for n, acc, conf in [(1, 0.5, 0.25), (3, 0.75, 0.875)]
+        ]
+        ece, mce = analysis._perform_calibration_analysis(bucket_performances)
+        self.assertAlmostEqual(ece, (1 * 0.25 + 3 * 0.125) / 4)
+        self.assertAlmostEqual(mce, 0.25)
+
+    def test_perform(self) -> None:
+        confidences = [0.1, 0.4, 0.5, 0.6, 0.9, 1.0]
+        correct = [1.0, 0.0, 1.0, 1.0, 0.0, 1.0]
+        cases = [
+            AnalysisCase(sample_id=i, features={"confidence": x})
+            for i, x in enumerate(confidences)
+        ]
+        analysis = CalibrationAnalysis(
+            description="foo", level="example", feature="confidence", num_buckets=2
+        )
+        result = analysis.perform(
+            cases=cases,
+            metrics={"Accuracy": AccuracyConfig().to_metric()},
+            stats={"Accuracy": SimpleMetricStats(np.array(correct))},
+            confidence_alpha=0.05,
+        )
+        result = narrow(CalibrationAnalysisResult, result)
+        buckets = result.bucket_performances
+        self.assertEqual([x.bucket_interval for x in buckets], [(0.0, 0.5), (0.5, 1.0)])
+        self.assertEqual([x.n_samples for x in buckets], [3, 3])
+        self.assertEqual(sorted(buckets[0].bucket_samples), [0, 1, 2])
+        accuracies = [x.results["Accuracy"].get_value(Score, "score") for x in buckets]
+        self.assertAlmostEqual(accuracies[0].value, 2 / 3)
+        self.assertAlmostEqual(accuracies[1].value, 2 / 3)
+        confidence = buckets[0].results["Accuracy"].get_value(Score, "confidence")
+        self.assertAlmostEqual(confidence.value, 1.0 / 3)
+        self.assertAlmostEqual(
+            result.expected_calibration_error,
+            (abs(2 / 3 - 1 / 3) + abs(2 / 3 - 5 / 6)) / 2,
+        )
+
+    def test_perform_calibration_analysis_empty(self) -> None:
+        analysis = CalibrationAnalysis(
+            description="foo", level="example", feature="confidence"
+        )
+        self.assertEqual(analysis._perform_calibration_analysis([]), (0.0, 0.0))
@@ -9,7 +9,7 @@ from typing import Any, cast, List, Tuple
 
 import numpy as np
 
-from explainaboard.analysis.case import AnalysisCase, AnalysisCaseCollection
+from explainaboard.analysis.case import AnalysisCaseCollection
 
 _INFINITE_INTERVAL = (-1e10, 1e10)
 
@@ -31,7 +31,7 @@ def find_range(
 
 
 def continuous(
-    sample_features: list[tuple[AnalysisCase, Any]],
+    feature_values: np.ndarray,
     bucket_number: int = 4,
     bucket_setting: Any = None,
 ) -> list[AnalysisCaseCollection]:
@@ -41,8 +41,8 @@ def continuous(
     equal-sized buckets.
 
     Args:
-        sample_features: A list of tuples including an analysis case, and a feature
-          value.
+        feature_values: A 1-dimensional array holding the feature value of each
+          analysis case.
         bucket_number: The number of buckets to generate.
         bucket_setting: Not used by this bucketing method, so it will fail if this is
           set to anything other than none.
@@ -50,13 +50,12 @@ def continuous(
     Returns:
         A list of AnalysisCaseCollections corresponding to the buckets.
     """
-    if len(sample_features) == 0:
+    if len(feature_values) == 0:
         return [AnalysisCaseCollection(samples=[], interval=_INFINITE_INTERVAL)]
     if bucket_setting is not None and len(bucket_setting) > 0:
         raise NotImplementedError('bucket_setting incompatible with continuous')
     # Bucketing different Attributes
-    cases = [x1 for x1, x2 in sample_features]
-    vals = np.array([x2 for x1, x2 in sample_features])
+    vals = feature_values
     # Function to convert numpy datatypes to Python native types
     conv = int if np.issubdtype(type(vals[0]), int) else float
     # Special case of one bucket
@@ -64,7 +63,7 @@ def continuous(
         max_val, min_val = conv(np.max(vals)), conv(np.min(vals))
         return [
             AnalysisCaseCollection(
-                samples=list(range(len(cases))),
+                samples=list(range(len(vals))),
                 interval=(min_val, max_val),
             )
         ]
@@ -105,7 +104,7 @@ def continuous(
 
 
 def discrete(
-    sample_features: list[tuple[AnalysisCase, Any]],
+    feature_values: np.ndarray,
     bucket_number: int = int(1e10),
     bucket_setting: Any = 1,
 ) -> list[AnalysisCaseCollection]:
@@ -114,7 +113,8 @@ def discrete(
     It will return buckets for the `bucket_number` most frequent discrete values.
 
     Args:
-        sample_features: Pairs of a analysis case and feature value.
+        feature_values: A 1-dimensional array holding the feature value of each
+          analysis case.
         bucket_number: Maximum number of buckets
         bucket_setting: Minimum number of examples per bucket
 
@@ -124,7 +124,7 @@ def discrete(
     feat2idx = {}
     if bucket_setting is None:
         bucket_setting = 0
-    for idx, (case, feat) in enumerate(sample_features):
+    for idx, feat in enumerate(feature_values.tolist()):
         if feat not in feat2idx:
             feat2idx[feat] = [idx]
         else:
@@ -141,15 +141,15 @@ def discrete(
 
 
 def fixed(
-    sample_features: list[tuple[AnalysisCase, Any]],
+    feature_values: np.ndarray,
     bucket_number: int,
     bucket_setting: Any,
 ) -> list[AnalysisCaseCollection]:
     """Bucketing based on pre-determined buckets.
 
     Args:
-        sample_features: A list of tuples including an analysis case, and a feature
-          value.
+        feature_values: A 1-dimensional array holding the feature value of each
+          analysis case.
         bucket_number: Ignored by this function.
         bucket_setting: A list of bucket names or intervals, depending on the type.
 
@@ -160,12 +160,10 @@ def fixed(
     if len(interval_or_names) == 0:
         raise ValueError("Can not determine bucket keys.")
 
-    features = [x[1] for x in sample_features]
-
     if isinstance(interval_or_names[0], str):
         names = cast(List[str], interval_or_names)
         name2idx: dict[str, list[int]] = {k: [] for k in names}
-        name_features = cast(List[str], features)
+        name_features = cast(List[str], feature_values.tolist())
 
         for idx, name in enumerate(name_features):
             if name in names:
@@ -174,15 +172,23 @@ def fixed(
         return [AnalysisCaseCollection(samples=v, name=k) for k, v in name2idx.items()]
     else:
         intervals = cast(List[Tuple[float, float]], interval_or_names)
-        interval2idx: dict[tuple[float, float], list[int]] = {k: [] for k in intervals}
-        interval_features = cast(List[float], features)
-
-        for idx, interval in enumerate(interval_features):
-            key = find_range(intervals, interval)
-            if key is not None:
-                interval2idx[key].append(idx)
+        interval_features = feature_values.astype(np.float64, copy=False)
+
+        # Each value is assigned to the first interval covering it, as find_range()
+        # does, but the comparisons are performed over the whole array at once.
+        unassigned = np.ones(len(interval_features), dtype=bool)
+        bucket_collections: list[AnalysisCaseCollection] = []
+        for interval in dict.fromkeys(intervals):
+            in_interval = (
+                unassigned
+                & (interval[0] <= interval_features)
+                & (interval_features <= interval[1])
+            )
+            unassigned &= ~in_interval
+            bucket_collections.append(
+                AnalysisCaseCollection(
+                    samples=np.flatnonzero(in_interval).tolist(), interval=interval
+                )
+            )
 
-        return [
-            AnalysisCaseCollection(samples=v, interval=k)
-            for k, v in interval2idx.items()
-        ]
+        return bucket_collections
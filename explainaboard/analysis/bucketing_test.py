@@ -0,0 +1,46 @@
+"""Tests for explainaboard.analysis.bucketing."""
+
+import unittest
+
+import numpy as np
+
+from explainaboard.analysis.bucketing import continuous, discrete, fixed
+
+
+class ContinuousTest(unittest.TestCase):
+    def test_empty(self) -> None:
+        buckets = continuous(np.array([]), bucket_number=2)
+        self.assertEqual(len(buckets), 1)
+        self.assertEqual(buckets[0].samples, [])
+
+    def test_split(self) -> None:
+        buckets = continuous(np.array([4, 1, 3, 2]), bucket_number=2)
+        self.assertEqual([x.samples for x in buckets], [[1, 3], [2, 0]])
+        self.assertEqual([x.interval for x in buckets], [(1, 2), (3, 4)])
+
+
+class DiscreteTest(unittest.TestCase):
+    def test_bucket_number_and_setting(self) -> None:
+        values = np.empty(6, dtype=object)
+        values[:] = ["a", "b", "a", "c", "a", "b"]
+        buckets = discrete(values, bucket_number=2, bucket_setting=2)
+        self.assertEqual([x.name for x in buckets], ["a", "b"])
+        self.assertEqual([x.samples for x in buckets], [[0, 2, 4], [1, 5]])
+
+
+class FixedTest(unittest.TestCase):
+    def test_names(self) -> None:
+        values = np.empty(4, dtype=object)
+        values[:] = ["a", "b", "a", "c"]
+        buckets = fixed(values, bucket_number=0, bucket_setting=["a", "c", "d"])
+        self.assertEqual([x.name for x in buckets], ["a", "c", "d"])
+        self.assertEqual([x.samples for x in buckets], [[0, 2], [3], []])
+
+    def test_intervals(self) -> None:
+        values = np.array([0.0, 0.5, 0.7, 1.0, 1.5])
+        buckets = fixed(
+            values, bucket_number=0, bucket_setting=[(0.0, 0.5), (0.5, 1.0)]
+        )
+        self.assertEqual([x.interval for x in buckets], [(0.0, 0.5), (0.5, 1.0)])
+        # Values on a shared boundary belong to the first interval.
+        self.assertEqual([x.samples for x in buckets], [[0, 1], [2, 3]])
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Callable, Iterable
 from typing import Any
 
-from lexicalrichness import LexicalRichness
 import sacrebleu
 
 from explainaboard.info import SysOutputInfo
@@ -83,6 +83,10 @@ def get_lexical_richness(text: str) -> float:
     Returns:
         The lexical richness value, or 0.0 if there are no effective words.
     """
+    # Imported here since lexicalrichness is slow to import and only used by this
+    # feature.
+    from lexicalrichness import LexicalRichness
+
     lex = LexicalRichness(text)
     results = 0.0
 
@@ -110,11 +114,12 @@ def accumulate_vocab_from_samples(
             A dictionary of vocabulary item -> frequency
             A dictionary of vocabulary item -> frequency rank
     """
-    vocab: dict[str, int] = {}
+    counter: Counter[str] = Counter()
     for sample in progress(samples):
-        for w in tokenizer(text_from_sample(sample)):
-            vocab[w] = vocab.get(w, 0) + 1
-    # the rank of each word based on its frequency
+        counter.update(tokenizer(text_from_sample(sample)).strs)
+    vocab = dict(counter)
+    # the rank of each word based on its frequency (words with the same frequency share
+    # the same rank)
     sorted_dict = {
         key: rank
         for rank, key in enumerate(sorted(set(vocab.values()), reverse=True), 1)
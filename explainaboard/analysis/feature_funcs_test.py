@@ -3,7 +3,11 @@
 
 import unittest
 
-from explainaboard.analysis.feature_funcs import get_basic_words
+from explainaboard.analysis.feature_funcs import (
+    accumulate_vocab_from_samples,
+    get_basic_words,
+)
+from explainaboard.utils.tokenizer import SingleSpaceTokenizer
 
 
 class FeatureFuncsTest(unittest.TestCase):
@@ -33,3 +37,12 @@ class FeatureFuncsTest(unittest.TestCase):
         self.assertEqual(get_basic_words("It is ."), 2 / 3)
         self.assertEqual(get_basic_words("It, is"), 0.5)
         self.assertEqual(get_basic_words("It , is"), 2 / 3)
+
+    def test_accumulate_vocab_from_samples(self) -> None:
+        samples = [{"text": "a b a"}, {"text": "c b a"}, {"text": "d"}]
+        vocab, vocab_rank = accumulate_vocab_from_samples(
+            samples, lambda x: x["text"], SingleSpaceTokenizer()
+        )
+        self.assertEqual(vocab, {"a": 3, "b": 2, "c": 1, "d": 1})
+        # Words with the same frequency share the same rank.
+        self.assertEqual(vocab_rank, {"a": 1, "b": 2, "c": 3, "d": 3})
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from explainaboard.constants import FileType
 from explainaboard.loaders.file_loader import (
     DatalabFileLoader,
@@ -12,6 +14,13 @@ from explainaboard.loaders.file_loader import (
 from explainaboard.loaders.loader import Loader
 
 
+def _parse_answers(answers: Any) -> Any:
+    """Normalizes answers so that `answers["text"]` is always a list of strings."""
+    if isinstance(answers, dict) and isinstance(answers.get("text"), str):
+        return {**answers, "text": [answers["text"]]}
+    return answers
+
+
 class QAExtractiveLoader(Loader):
     """Loader for the extractive QA task."""
 
@@ -44,7 +53,11 @@ class QAExtractiveLoader(Loader):
                         str,
                         strip_before_parsing=False,
                     ),
-                    FileLoaderField(target_field_names[2], target_field_names[2]),
+                    FileLoaderField(
+                        target_field_names[2],
+                        target_field_names[2],
+                        parser=_parse_answers,
+                    ),
                 ]
             ),
             FileType.datalab: DatalabFileLoader(
@@ -61,7 +74,9 @@ class QAExtractiveLoader(Loader):
                         str,
                         strip_before_parsing=False,
                     ),
-                    FileLoaderField("answers_column", target_field_names[2]),
+                    FileLoaderField(
+                        "answers_column", target_field_names[2], parser=_parse_answers
+                    ),
                 ]
             ),
         }
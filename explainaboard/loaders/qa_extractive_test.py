@@ -1,8 +1,9 @@
 """Tests for explainaboard.loaders.extractive_qa."""
 
+import json
 import unittest
 
-from explainaboard.constants import TaskType
+from explainaboard.constants import FileType, Source, TaskType
 from explainaboard.loaders.loader_factory import get_loader_class
 from explainaboard.loaders.qa_extractive import QAExtractiveLoader
 
@@ -10,3 +11,16 @@ from explainaboard.loaders.qa_extractive import QAExtractiveLoader
 class ExtractiveQALoaderTest(unittest.TestCase):
     def test_get_loader_class(self) -> None:
         self.assertIs(get_loader_class(TaskType.qa_extractive), QAExtractiveLoader)
+
+    def test_answers_text_is_normalized_to_list(self) -> None:
+        content = json.dumps(
+            [
+                {"context": "a b", "question": "c", "answers": {"text": "a"}},
+                {"context": "a b", "question": "c", "answers": {"text": ["a", "b"]}},
+            ]
+        )
+        loader = QAExtractiveLoader.default_dataset_file_loaders()[FileType.json]
+        samples = loader.load(content, Source.in_memory).samples
+        self.assertEqual(
+            [x["answers"] for x in samples], [{"text": ["a"]}, {"text": ["a", "b"]}]
+        )
@@ -29,17 +29,17 @@ def report_to_sysout(report: SysOutputInfo) -> list[dict]:
         # feature_perfs has `n_buckets` elements, each corresponding to a single bucket
         for bucket in feature_buckets.bucket_performances:
 
-            # loop through and record all the metrics that describe this bucket
-            example_features: dict[str, Any] = {}
-            for metric_name, metric_result in bucket.results.items():
-
-                example_features['feature_name'] = feature_buckets.name
-                example_features['bucket_interval'] = bucket.bucket_interval
-                example_features['bucket_name'] = bucket.bucket_name
-                example_features['bucket_size'] = bucket.n_samples
-                example_features[metric_name] = metric_result.get_value(
-                    Score, "value"
-                ).value
+            # record the bucket itself and all the metrics that describe it
+            example_features: dict[str, Any] = {
+                'feature_name': feature_buckets.name,
+                'bucket_interval': bucket.bucket_interval,
+                'bucket_name': bucket.bucket_name,
+                'bucket_size': bucket.n_samples,
+            }
+            example_features.update(
+                (metric_name, metric_result.get_value(Score, "value").value)
+                for metric_name, metric_result in bucket.results.items()
+            )
 
             meta_examples.append(example_features)
     return meta_examples
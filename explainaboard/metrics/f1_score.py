@@ -24,6 +24,29 @@ from explainaboard.utils.span_utils import (
 from explainaboard.utils.typing_utils import narrow
 
 
+def _number_int_labels(
+    true_data: np.ndarray, pred_data: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """Numbers integer labels in order of appearance without a Python loop.
+
+    Args:
+      true_data: True labels.
+      pred_data: Predicted labels.
+
+    Returns:
+      Class IDs of the true labels, those of the predicted labels, and the number of
+      classes. Classes are numbered in order of their first appearance in the true
+      labels followed by the predicted labels.
+    """
+    labels, first_index, inverse = np.unique(
+        np.concatenate([true_data, pred_data]), return_index=True, return_inverse=True
+    )
+    class_ids = np.empty(len(labels), dtype=np.intp)
+    class_ids[np.argsort(first_index)] = np.arange(len(labels))
+    ids = class_ids[inverse.ravel()]
+    return ids[: len(true_data)], ids[len(true_data) :], len(labels)
+
+
 @dataclass
 @common_registry.register("F1ScoreConfig")
 class F1ScoreConfig(MetricConfig):
@@ -54,12 +77,15 @@ class F1Score(Metric):
         """See Metric.is_simple_average."""
         return False
 
-    def calc_stats_from_data(self, true_data: list, pred_data: list) -> MetricStats:
+    def calc_stats_from_data(
+        self, true_data: list | np.ndarray, pred_data: list | np.ndarray
+    ) -> MetricStats:
         """Return sufficient statistics necessary to compute f-score.
 
         Args:
           true_data: True outputs
-          pred_data: Predicted outputs
+          pred_data: Predicted outputs. Labels may also be given as integer arrays
+            for both true and predicted outputs, which avoids mapping them one by one.
 
         Returns:
           Returns stats for each class (integer id c) in the following columns of
@@ -73,27 +99,44 @@ class F1Score(Metric):
         config = narrow(F1ScoreConfig, self.config)
         stat_mult: int = 4 if config.separate_match else 3
 
-        id_map: dict[str, int] = {}
-        for ignore_class in config.ignore_classes:
-            id_map[ignore_class] = -1
-
-        for word in itertools.chain(true_data, pred_data):
-            if word not in id_map:
-                id_map[word] = len(id_map)
+        # Classes are numbered in order of appearance in the true and predicted data.
         n_data = len(true_data)
-        n_classes = len(id_map)
+        if (
+            not config.ignore_classes
+            and isinstance(true_data, np.ndarray)
+            and isinstance(pred_data, np.ndarray)
+            and true_data.dtype.kind in 'iu'
+            and pred_data.dtype.kind in 'iu'
+        ):
+            true_ids, pred_ids, n_classes = _number_int_labels(true_data, pred_data)
+        else:
+            id_map: dict[str, int] = {}
+            for ignore_class in config.ignore_classes:
+                id_map[ignore_class] = -1
+            true_ids, pred_ids = (
+                np.fromiter(
+                    (id_map.setdefault(word, len(id_map)) for word in data),
+                    dtype=np.intp,
+                    count=n_data,
+                )
+                for data in (true_data, pred_data)
+            )
+            n_classes = len(id_map)
+
+        # Each example contributes at most 1 to each statistic, so the statistics are
+        # set at once over all examples.
+        rows = np.arange(n_data)
+        true_valid = true_ids != -1
+        pred_valid = pred_ids != -1
+        matched = pred_valid & (true_ids == pred_ids)
+        # Each statistic is either 0 or 1, so it is stored in the smallest integer type.
         # This is a bit memory inefficient if there's a large number of classes
-        stats = np.zeros((n_data, n_classes * stat_mult))
-        for i, (t, p) in enumerate(zip(true_data, pred_data)):
-            tid, pid = id_map[t], id_map[p]
-            if tid != -1:
-                stats[i, tid * stat_mult + 0] += 1
-            if pid != -1:
-                stats[i, pid * stat_mult + 1] += 1
-                if tid == pid:
-                    stats[i, tid * stat_mult + 2] += 1
-                    if config.separate_match:
-                        stats[i, tid * stat_mult + 3] += 1
+        stats = np.zeros((n_data, n_classes * stat_mult), dtype=np.int8)
+        stats[rows[true_valid], true_ids[true_valid] * stat_mult + 0] = 1
+        stats[rows[pred_valid], pred_ids[pred_valid] * stat_mult + 1] = 1
+        stats[rows[matched], true_ids[matched] * stat_mult + 2] = 1
+        if config.separate_match:
+            stats[rows[matched], true_ids[matched] * stat_mult + 3] = 1
         return SimpleMetricStats(stats)
 
     def _calc_metric_from_aggregate(self, agg_stats: np.ndarray) -> np.ndarray:
@@ -118,11 +161,13 @@ class F1Score(Metric):
                 np.sum(x, axis=1) for x in (true, pred, true_match, pred_match)
             )
 
-        np.seterr(invalid='ignore')
-        p = np.where(pred != 0.0, pred_match / pred, 0.0)
-        r = np.where(true != 0.0, true_match / true, 0.0)
-        f1 = np.where(p + r != 0.0, 2 * p * r / (p + r), 0.0)
-        np.seterr(invalid='warn')
+        # Divide only where the denominator is non-zero, and use 0 otherwise.
+        p = np.divide(pred_match, pred, out=np.zeros(pred.shape), where=pred != 0.0)
+        r = np.divide(true_match, true, out=np.zeros(true.shape), where=true != 0.0)
+        p_plus_r = p + r
+        f1 = np.divide(
+            2 * p * r, p_plus_r, out=np.zeros(p_plus_r.shape), where=p_plus_r != 0.0
+        )
 
         if config.average == 'macro':
             f1 = np.mean(f1, axis=1)
@@ -207,14 +252,14 @@ class SeqF1Score(F1Score):
 
     def calc_stats_from_data(
         self,
-        true_data: list[list[str]],
-        pred_data: list[list[str]],
+        true_data: list[list[str]] | np.ndarray,
+        pred_data: list[list[str]] | np.ndarray,
     ) -> MetricStats:
         """Return sufficient statistics necessary to compute f-score.
 
         Args:
-            true_data: True outputs
-            pred_data: Predicted outputs
+            true_data: True outputs, a tag sequence for each example
+            pred_data: Predicted outputs, a tag sequence for each example
 
         Returns:
             Returns stats for each class (integer id c) in the following columns of
@@ -249,18 +294,38 @@ class SeqF1Score(F1Score):
         )
         tag_ids = {k: v for v, k in enumerate([x for x in all_classes])}
 
-        # 3. Create the sufficient statistics
-        stat_mult = 3
+        # 3. Pack each span into an integer key of (example, class, start, end), so
+        # that the matched spans over all examples are obtained at once.
         n_data, n_classes = len(true_data), len(tag_ids)
-        # This is a bit memory inefficient if there's a large number of classes
-        stats = np.zeros((n_data, n_classes * stat_mult))
+        # Spans start and end within [0, max_len).
+        max_len = 1 + max(
+            (len(tags) for tags in itertools.chain(true_data, pred_data)), default=0
+        )
 
-        for i, (true_spans, pred_spans) in enumerate(
-            zip(true_spans_list, pred_spans_list)
-        ):
-            matched_spans = set(true_spans).intersection(pred_spans)
-            for offset, spans in enumerate((true_spans, pred_spans, matched_spans)):
-                for span in spans:
-                    c = tag_ids[span[0]]
-                    stats[i, c * stat_mult + offset] += 1
-        return SimpleMetricStats(stats)
+        def pack_spans(spans_list: list[list[tuple[str, int, int]]]) -> np.ndarray:
+            return np.fromiter(
+                (
+                    ((i * n_classes + tag_ids[tag]) * max_len + start) * max_len + end
+                    for i, spans in enumerate(spans_list)
+                    for tag, start, end in spans
+                ),
+                dtype=np.int64,
+            )
+
+        true_keys = pack_spans(true_spans_list)
+        pred_keys = pack_spans(pred_spans_list)
+        # Spans extracted from a sequence never share the same positions.
+        matched_keys = np.intersect1d(true_keys, pred_keys, assume_unique=True)
+
+        # 4. Create the sufficient statistics
+        stat_mult = 3
+        n_stats = n_classes * stat_mult
+        # This is a bit memory inefficient if there's a large number of classes
+        stats = np.zeros(n_data * n_stats)
+        for offset, keys in enumerate((true_keys, pred_keys, matched_keys)):
+            example_ids, class_ids = np.divmod(keys // (max_len * max_len), n_classes)
+            stats += np.bincount(
+                example_ids * n_stats + class_ids * stat_mult + offset,
+                minlength=n_data * n_stats,
+            )
+        return SimpleMetricStats(stats.reshape(n_data, n_stats))
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import unittest
 
+import numpy as np
 from sklearn.metrics import f1_score
 
 from explainaboard.metrics.f1_score import (
@@ -13,6 +14,7 @@ from explainaboard.metrics.f1_score import (
     SeqF1ScoreConfig,
 )
 from explainaboard.metrics.metric import Score
+from explainaboard.utils.typing_utils import narrow
 
 
 class F1ScoreConfigTest(unittest.TestCase):
@@ -69,6 +71,42 @@ class F1ScoreTest(unittest.TestCase):
         result = metric.evaluate(true, pred, confidence_alpha=None)
         self.assertAlmostEqual(result.get_value(Score, "score").value, sklearn_f1)
 
+    def test_calc_stats_from_data(self) -> None:
+        metric = F1ScoreConfig(separate_match=True, ignore_classes=['o']).to_metric()
+        true = ['a', 'o', 'b', 'a']
+        pred = ['a', 'a', 'o', 'b']
+        # Column 0-3 is reserved for the ignored class 'o'.
+        np.testing.assert_array_equal(
+            metric.calc_stats_from_data(true, pred).get_data(),
+            [
+                [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0],
+                [0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0],
+            ],
+        )
+
+    def test_calc_stats_from_data_int_array(self) -> None:
+        metric = narrow(F1Score, F1ScoreConfig(separate_match=True).to_metric())
+        true = [3, 1, 3, 2, 1]
+        pred = [1, 1, 5, 2, 3]
+        # Integer arrays give the same statistics as lists of the same labels.
+        np.testing.assert_array_equal(
+            metric.calc_stats_from_data(np.array(true), np.array(pred)).get_data(),
+            metric.calc_stats_from_data(true, pred).get_data(),
+        )
+
+    def test_calc_metric_from_aggregate_zero_division(self) -> None:
+        metric = F1ScoreConfig(average='macro').to_metric()
+        # (true, pred, match) of 3 classes: the 2nd class is never predicted and the
+        # 3rd class has no samples.
+        agg_stats = np.array([[2.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0]])
+        with np.errstate(all='raise'):
+            f1 = metric.calc_metric_from_aggregate(agg_stats)
+            # The error handling set by the caller is kept as is.
+            self.assertEqual(np.geterr()['invalid'], 'raise')
+        np.testing.assert_allclose(f1, [(2 / 3) / 3])
+
 
 class SeqF1ScoreConfigTest(unittest.TestCase):
     def test_serialize(self) -> None:
@@ -137,3 +175,20 @@ class SeqF1ScoreTest(unittest.TestCase):
         metric = SeqF1ScoreConfig(average='macro', tag_schema='bio').to_metric()
         result = metric.evaluate(true, pred, confidence_alpha=None)
         self.assertAlmostEqual(result.get_value(Score, "score").value, 3.0 / 4.0)
+
+    def test_calc_stats_from_data(self) -> None:
+        true = [['B-MISC', 'I-MISC', 'B-MISC'], ['O'], ['B-MISC', 'O']]
+        pred = [['B-MISC', 'B-MISC', 'B-MISC'], ['B-MISC'], ['B-MISC', 'O']]
+        metric = SeqF1ScoreConfig(tag_schema='bio').to_metric()
+        np.testing.assert_array_equal(
+            metric.calc_stats_from_data(true, pred).get_data(),
+            [[2, 3, 1], [0, 1, 0], [1, 1, 1]],
+        )
+
+    def test_calc_stats_from_data_malformed_tags(self) -> None:
+        true = [['B-PER', 'O', 'O', 'B-LOC']]
+        pred = [['B-PER', 'X', 'O', 'B-LOC']]
+        metric = SeqF1ScoreConfig(tag_schema='bio').to_metric()
+        stats = metric.calc_stats_from_data(true, pred).get_data()
+        # Both spans match, in whichever order the classes are numbered.
+        np.testing.assert_array_equal(stats, [[1, 1, 1, 1, 1, 1]])
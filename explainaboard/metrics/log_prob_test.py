@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import unittest
 
+import numpy as np
+
 from explainaboard.metrics.log_prob import LogProb, LogProbConfig
+from explainaboard.utils.typing_utils import unwrap
 
 
 class LogProbConfigTest(unittest.TestCase):
@@ -26,3 +29,14 @@ class LogProbConfigTest(unittest.TestCase):
 
     def test_to_metric(self) -> None:
         self.assertIsInstance(LogProbConfig().to_metric(), LogProb)
+
+
+class LogProbTest(unittest.TestCase):
+    def test_calc_confidence_interval_with_infinite_log_prob(self) -> None:
+        metric = LogProbConfig().to_metric()
+        stats = metric.calc_stats_from_data([], [[1.0], [2.0], [-np.inf], [3.0]])
+        ci = unwrap(metric.calc_confidence_interval(stats, 0.05))
+        # Resamples that do not draw the -inf example have finite means.
+        self.assertEqual(ci[0], -np.inf)
+        self.assertGreaterEqual(ci[1], 1.0)
+        self.assertLessEqual(ci[1], 3.0)
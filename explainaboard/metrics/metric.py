@@ -21,6 +21,43 @@ from explainaboard.utils.typing_utils import narrow
 _MIN_SAMPLE_SIZE = 30
 
 
+def _bootstrap_means(
+    data: np.ndarray[tuple[int, int], Any],
+    indices: np.ndarray[tuple[int, int], Any],
+) -> np.ndarray[tuple[int, int], Any]:
+    """Average the resampled statistics without materializing them.
+
+    This is equivalent to `np.mean(data[indices], axis=-2)`, but computes the means
+    from the number of times each example is drawn in each resample.
+
+    Args:
+        data: The sufficient statistics with shape `[num_examples, num_statistics]`.
+        indices: The resampled example indices with shape
+          `[num_iterations, sample_size]`.
+
+    Returns:
+        The means of each resample with shape `[num_iterations, num_statistics]`.
+    """
+    num_iterations, sample_size = indices.shape
+    num_examples = data.shape[0]
+    offsets = np.arange(num_iterations)[:, np.newaxis] * num_examples
+    counts = np.bincount(
+        (indices + offsets).ravel(), minlength=num_iterations * num_examples
+    ).reshape(num_iterations, num_examples)
+
+    # Statistics that are zero in every example are zero in every resample as well.
+    # This is common for per-class statistics, e.g., those of F1Score over a bucket
+    # that contains only a few classes.
+    active = np.flatnonzero(np.any(data != 0, axis=0))
+    # The product is taken in floating point, which is much faster than the integer
+    # product for integer statistics.
+    if len(active) == data.shape[1]:
+        return (counts @ data.astype(np.float64, copy=False)) / sample_size
+    means = np.zeros((num_iterations, data.shape[1]))
+    means[:, active] = (counts @ data[:, active].astype(np.float64)) / sample_size
+    return means
+
+
 # TODO(odashi): See mypy/issues/4717
 @dataclass(frozen=True)  # type: ignore
 class MetricValue(Serializable, metaclass=abc.ABCMeta):
@@ -557,7 +594,7 @@ class Metric(metaclass=abc.ABCMeta):
                 "Confidence interval can't be calculated for batched data."
             )
 
-        stats_data = stats.get_batch_data() if stats.is_batched() else stats.get_data()
+        stats_data = stats.get_data()
         num_stats = stats.num_statistics()
         sample_size = len(stats)
 
@@ -584,13 +621,23 @@ class Metric(metaclass=abc.ABCMeta):
             )
         # Do bootstrapping otherwise
         else:
-            all_indices = np.array(range(sample_size))
+            # Draws all resamples at once. This is the same as rng.choice() with
+            # replacement, without materializing the population of indices.
             rng = np.random.default_rng()
-            all_indices = rng.choice(
-                all_indices, size=(num_iterations, sample_size), replace=True
-            )
-            filt_stats = stats.filter(all_indices)
-            agg_stats = self.aggregate_stats(filt_stats)
+            all_indices = rng.integers(sample_size, size=(num_iterations, sample_size))
+            agg_stats: np.ndarray
+            if (
+                type(self)._aggregate_stats is Metric._aggregate_stats
+                and np.isfinite(stats_data).all()
+            ):
+                # The default aggregation is the mean over examples, which is
+                # obtained from the resampling counts with a single product. The
+                # product is not used for non-finite statistics, since examples that
+                # are not drawn would contribute 0 * inf = nan.
+                agg_stats = _bootstrap_means(stats_data, all_indices)
+            else:
+                filt_stats = stats.filter(all_indices)
+                agg_stats = self.aggregate_stats(filt_stats)
             samp_results = self.calc_metric_from_aggregate(agg_stats)
 
             if samp_results.ndim != 1:
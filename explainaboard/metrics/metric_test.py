@@ -10,6 +10,7 @@ import unittest
 import numpy as np
 
 from explainaboard.metrics.metric import (
+    _bootstrap_means,
     ConfidenceInterval,
     Metric,
     MetricConfig,
@@ -309,6 +310,32 @@ class MetricTest(unittest.TestCase):
         self.assertGreaterEqual(ci[0], 1.0)
         self.assertLessEqual(ci[1], 6.0)
 
+    def test_bootstrap_means(self) -> None:
+        rng = np.random.default_rng(12345)
+        data = rng.random((7, 3))
+        indices = rng.integers(0, 7, size=(5, 7))
+        np.testing.assert_allclose(
+            _bootstrap_means(data, indices), np.mean(data[indices], axis=-2)
+        )
+
+    def test_bootstrap_means_with_zero_statistics(self) -> None:
+        rng = np.random.default_rng(12345)
+        data = rng.random((7, 4))
+        data[:, 1] = 0.0
+        data[:, 3] = 0.0
+        indices = rng.integers(0, 7, size=(5, 7))
+        np.testing.assert_allclose(
+            _bootstrap_means(data, indices), np.mean(data[indices], axis=-2)
+        )
+
+    def test_bootstrap_means_with_integer_statistics(self) -> None:
+        rng = np.random.default_rng(12345)
+        data = rng.integers(0, 2, size=(7, 3), dtype=np.int8)
+        indices = rng.integers(0, 7, size=(5, 7))
+        means = _bootstrap_means(data, indices)
+        self.assertEqual(means.dtype, np.float64)
+        np.testing.assert_allclose(means, np.mean(data[indices], axis=-2))
+
     def test_calc_confidence_interval_bootstrap_multi_agg(self) -> None:
         metric = _DummyMetric(_DummyMetricConfig("test", is_simple_average=False))
         stats = SimpleMetricStats(np.array([[0.5, 1.5], [1.5, 2.5], [2.5, 3.5]]))
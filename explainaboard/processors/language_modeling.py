@@ -200,13 +200,16 @@ class LanguageModelingProcessor(Processor):
                             sys_info, output, case, statistics
                         )
                 cases.append(case)
+        # Both metrics are calculated from the same statistics, which are gathered
+        # into a single array without an intermediate list.
+        tok_log_probs = np.fromiter(
+            (x.features['tok_log_prob'] for x in cases),
+            dtype=np.float64,
+            count=len(cases),
+        )
         metric_stats: dict[str, MetricStats] = {
-            "Perplexity": SimpleMetricStats(
-                np.array([x.features['tok_log_prob'] for x in cases])
-            ),
-            "LogProb": SimpleMetricStats(
-                np.array([x.features['tok_log_prob'] for x in cases])
-            ),
+            "Perplexity": SimpleMetricStats(tok_log_probs),
+            "LogProb": SimpleMetricStats(tok_log_probs),
         }
         return cases, metric_stats
 
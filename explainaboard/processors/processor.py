@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import abc
 from collections.abc import Iterable
+import functools
 from typing import Any, cast, final, Optional
 
 from eaas.async_client import AsyncClient
@@ -69,6 +70,27 @@ class Processor(metaclass=abc.ABCMeta):
         """Returns the analyses to be performed."""
         ...
 
+    @classmethod
+    def _create_default_features(cls) -> dict[str, FeatureType]:
+        """Creates the features of the example level.
+
+        Processors that read their features through `_default_features()` must
+        override this.
+        """
+        raise NotImplementedError(f"{cls.__name__} has no default features")
+
+    @final
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _default_features(cls) -> dict[str, FeatureType]:
+        """Returns the features of the example level, created once per class.
+
+        FeatureTypes are immutable, so the features made by `_create_default_features`
+        are shared by all analysis levels of the processor class. The returned dict
+        must be copied before it is modified.
+        """
+        return cls._create_default_features()
+
     def continuous_feature_analyses(self) -> list[Analysis]:
         """Return analyses over all continuous features in the analysis levels."""
         analyses: list[Analysis] = []
@@ -366,22 +388,31 @@ class Processor(metaclass=abc.ABCMeta):
         }
 
         # Calculate features
+        # The properties of each feature are looked up once here, not once per example.
+        feat_specs = [
+            (
+                feat_name,
+                feat_spec.optional,
+                feat_spec.func,
+                feat_spec.require_training_set,
+            )
+            for feat_name, feat_spec in analysis_level.features.items()
+        ]
         cases: list[AnalysisCase] = []
         for i, output in progress(
             enumerate(sys_output), desc='calculating example-level features'
         ):
             case = AnalysisCase(sample_id=i, features={})
-            for feat_name, feat_spec in analysis_level.features.items():
-                if feat_name not in output and feat_spec.optional:
+            features = case.features
+            for feat_name, optional, func, require_training_set in feat_specs:
+                if optional and feat_name not in output:
                     continue
-                if feat_spec.func is None:
-                    case.features[feat_name] = output[feat_name]
-                elif not feat_spec.require_training_set:
-                    case.features[feat_name] = feat_spec.func(sys_info, output, case)
+                if func is None:
+                    features[feat_name] = output[feat_name]
+                elif not require_training_set:
+                    features[feat_name] = func(sys_info, output, case)
                 elif statistics is not None:
-                    case.features[feat_name] = feat_spec.func(
-                        sys_info, output, case, statistics
-                    )
+                    features[feat_name] = func(sys_info, output, case, statistics)
             cases.append(case)
         return cases, metric_stats
 
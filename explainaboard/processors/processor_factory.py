@@ -2,74 +2,93 @@
 
 from __future__ import annotations
 
+import importlib
+
 from explainaboard import TaskType
-from explainaboard.processors.argument_pair_extraction import (
-    ArgumentPairExtractionProcessor,
-)
-from explainaboard.processors.argument_pair_identification import (
-    ArgumentPairIdentificationProcessor,
-)
-from explainaboard.processors.aspect_based_sentiment_classification import (
-    AspectBasedSentimentClassificationProcessor,
-)
-from explainaboard.processors.chunking import ChunkingProcessor
-from explainaboard.processors.cloze_generative import ClozeGenerativeProcessor
-from explainaboard.processors.cloze_multiple_choice import ClozeMultipleChoiceProcessor
-from explainaboard.processors.conditional_generation import (
-    ConditionalGenerationProcessor,
-)
-from explainaboard.processors.grammatical_error_correction import (
-    GrammaticalErrorCorrectionProcessor,
-)
-from explainaboard.processors.kg_link_tail_prediction import (
-    KGLinkTailPredictionProcessor,
-)
-from explainaboard.processors.language_modeling import LanguageModelingProcessor
-from explainaboard.processors.machine_translation import MachineTranslationProcessor
-from explainaboard.processors.meta_evaluation_nlg import MetaEvaluationNLGProcessor
-from explainaboard.processors.meta_evaluation_wmt_da import MetaEvaluationWMTDAProcessor
-from explainaboard.processors.named_entity_recognition import NERProcessor
+
+# Metric modules register their MetricConfig classes on import, which is required to
+# deserialize them later. They are cheap to import, so they are loaded eagerly even
+# though the processors that use them are not.
+import explainaboard.metrics.accuracy  # noqa: F401
+import explainaboard.metrics.auxiliary.qa_table_text_hybrid_auxiliary  # noqa: F401
+import explainaboard.metrics.continuous  # noqa: F401
+import explainaboard.metrics.eaas  # noqa: F401
+import explainaboard.metrics.external_eval  # noqa: F401
+import explainaboard.metrics.extractive_qa  # noqa: F401
+import explainaboard.metrics.f1_score  # noqa: F401
+import explainaboard.metrics.log_prob  # noqa: F401
+import explainaboard.metrics.meta_evaluation  # noqa: F401
+import explainaboard.metrics.qa_table_text_hybrid  # noqa: F401
+import explainaboard.metrics.ranking  # noqa: F401
 from explainaboard.processors.processor import Processor
-from explainaboard.processors.qa_extractive import QAExtractiveProcessor
-from explainaboard.processors.qa_multiple_choice import QAMultipleChoiceProcessor
-from explainaboard.processors.qa_open_domain import QAOpenDomainProcessor
-from explainaboard.processors.qa_tat import QATatProcessor
-from explainaboard.processors.summarization import SummarizationProcessor
-from explainaboard.processors.tabular_classification import (
-    TabularClassificationProcessor,
-)
-from explainaboard.processors.tabular_regression import TabularRegressionProcessor
-from explainaboard.processors.text_classification import TextClassificationProcessor
-from explainaboard.processors.text_pair_classification import (
-    TextPairClassificationProcessor,
-)
-from explainaboard.processors.word_segmentation import CWSProcessor
 
-_TASK_TYPE_TO_PROCESSOR: dict[TaskType, type[Processor]] = {
-    TaskType.text_classification: TextClassificationProcessor,
-    TaskType.named_entity_recognition: NERProcessor,
-    TaskType.qa_extractive: QAExtractiveProcessor,
-    TaskType.summarization: SummarizationProcessor,
-    TaskType.machine_translation: MachineTranslationProcessor,
-    TaskType.text_pair_classification: TextPairClassificationProcessor,
-    TaskType.aspect_based_sentiment_classification: AspectBasedSentimentClassificationProcessor,  # noqa: E501
-    TaskType.kg_link_tail_prediction: KGLinkTailPredictionProcessor,
-    TaskType.qa_multiple_choice: QAMultipleChoiceProcessor,
-    TaskType.qa_open_domain: QAOpenDomainProcessor,
-    TaskType.qa_tat: QATatProcessor,
-    TaskType.conditional_generation: ConditionalGenerationProcessor,
-    TaskType.word_segmentation: CWSProcessor,
-    TaskType.language_modeling: LanguageModelingProcessor,
-    TaskType.chunking: ChunkingProcessor,
-    TaskType.cloze_mutiple_choice: ClozeMultipleChoiceProcessor,
-    TaskType.cloze_generative: ClozeGenerativeProcessor,
-    TaskType.grammatical_error_correction: GrammaticalErrorCorrectionProcessor,
-    TaskType.meta_evaluation_wmt_da: MetaEvaluationWMTDAProcessor,
-    TaskType.tabular_regression: TabularRegressionProcessor,
-    TaskType.tabular_classification: TabularClassificationProcessor,
-    TaskType.argument_pair_extraction: ArgumentPairExtractionProcessor,
-    TaskType.meta_evaluation_nlg: MetaEvaluationNLGProcessor,
-    TaskType.argument_pair_identification: ArgumentPairIdentificationProcessor,
+# Module (under explainaboard.processors) and class name of the Processor of each task.
+# The modules are imported on demand, since importing all of them at once pulls in a
+# number of heavy dependencies which are used only by a few tasks.
+_TASK_TYPE_TO_PROCESSOR: dict[TaskType, tuple[str, str]] = {
+    TaskType.text_classification: (
+        "text_classification",
+        "TextClassificationProcessor",
+    ),
+    TaskType.named_entity_recognition: ("named_entity_recognition", "NERProcessor"),
+    TaskType.qa_extractive: ("qa_extractive", "QAExtractiveProcessor"),
+    TaskType.summarization: ("summarization", "SummarizationProcessor"),
+    TaskType.machine_translation: (
+        "machine_translation",
+        "MachineTranslationProcessor",
+    ),
+    TaskType.text_pair_classification: (
+        "text_pair_classification",
+        "TextPairClassificationProcessor",
+    ),
+    TaskType.aspect_based_sentiment_classification: (
+        "aspect_based_sentiment_classification",
+        "AspectBasedSentimentClassificationProcessor",
+    ),
+    TaskType.kg_link_tail_prediction: (
+        "kg_link_tail_prediction",
+        "KGLinkTailPredictionProcessor",
+    ),
+    TaskType.qa_multiple_choice: ("qa_multiple_choice", "QAMultipleChoiceProcessor"),
+    TaskType.qa_open_domain: ("qa_open_domain", "QAOpenDomainProcessor"),
+    TaskType.qa_tat: ("qa_tat", "QATatProcessor"),
+    TaskType.conditional_generation: (
+        "conditional_generation",
+        "ConditionalGenerationProcessor",
+    ),
+    TaskType.word_segmentation: ("word_segmentation", "CWSProcessor"),
+    TaskType.language_modeling: ("language_modeling", "LanguageModelingProcessor"),
+    TaskType.chunking: ("chunking", "ChunkingProcessor"),
+    TaskType.cloze_mutiple_choice: (
+        "cloze_multiple_choice",
+        "ClozeMultipleChoiceProcessor",
+    ),
+    TaskType.cloze_generative: ("cloze_generative", "ClozeGenerativeProcessor"),
+    TaskType.grammatical_error_correction: (
+        "grammatical_error_correction",
+        "GrammaticalErrorCorrectionProcessor",
+    ),
+    TaskType.meta_evaluation_wmt_da: (
+        "meta_evaluation_wmt_da",
+        "MetaEvaluationWMTDAProcessor",
+    ),
+    TaskType.tabular_regression: ("tabular_regression", "TabularRegressionProcessor"),
+    TaskType.tabular_classification: (
+        "tabular_classification",
+        "TabularClassificationProcessor",
+    ),
+    TaskType.argument_pair_extraction: (
+        "argument_pair_extraction",
+        "ArgumentPairExtractionProcessor",
+    ),
+    TaskType.meta_evaluation_nlg: (
+        "meta_evaluation_nlg",
+        "MetaEvaluationNLGProcessor",
+    ),
+    TaskType.argument_pair_identification: (
+        "argument_pair_identification",
+        "ArgumentPairIdentificationProcessor",
+    ),
 }
 
 
@@ -86,7 +105,9 @@ def get_processor_class(task: TaskType) -> type[Processor]:
         ValueError: if the given task is not supported.
     """
     try:
-        cls = _TASK_TYPE_TO_PROCESSOR[task]
+        module_name, class_name = _TASK_TYPE_TO_PROCESSOR[task]
     except KeyError:
         raise ValueError(f"No Processor is defined for the task: {task}")
+    module = importlib.import_module(f"explainaboard.processors.{module_name}")
+    cls: type[Processor] = getattr(module, class_name)
     return cls
@@ -5,7 +5,11 @@ from __future__ import annotations
 import unittest
 
 from explainaboard import TaskType
-from explainaboard.processors.processor_factory import get_processor_class
+from explainaboard.processors.processor import Processor
+from explainaboard.processors.processor_factory import (
+    _TASK_TYPE_TO_PROCESSOR,
+    get_processor_class,
+)
 from explainaboard.processors.text_classification import TextClassificationProcessor
 
 
@@ -18,3 +22,14 @@ class ProcessorFactoryTest(unittest.TestCase):
             get_processor_class(TaskType.text_classification),
             TextClassificationProcessor,
         )
+
+    def test_get_processor_class_all_tasks(self) -> None:
+        for task in _TASK_TYPE_TO_PROCESSOR:
+            with self.subTest(task=task):
+                cls = get_processor_class(task)
+                self.assertTrue(issubclass(cls, Processor))
+                self.assertEqual(cls.task_type(), task)
+
+    def test_get_processor_class_unsupported(self) -> None:
+        with self.assertRaisesRegex(ValueError, "No Processor is defined"):
+            get_processor_class(TaskType.ranking_with_context)
@@ -0,0 +1,41 @@
+"""Tests for explainaboard.processors.processor"""
+
+from __future__ import annotations
+
+import unittest
+
+from explainaboard.processors.processor import Processor
+from explainaboard.processors.qa_extractive import QAExtractiveProcessor
+from explainaboard.processors.tabular_classification import (
+    TabularClassificationProcessor,
+)
+from explainaboard.processors.text_classification import TextClassificationProcessor
+
+# Processors that create their default features through
+# Processor._create_default_features.
+_PROCESSORS_WITH_DEFAULT_FEATURES: list[type[Processor]] = [
+    QAExtractiveProcessor,
+    TabularClassificationProcessor,
+    TextClassificationProcessor,
+]
+
+
+class ProcessorTest(unittest.TestCase):
+    def test_default_features_are_created_once_per_class(self) -> None:
+        features = []
+        for processor_class in _PROCESSORS_WITH_DEFAULT_FEATURES:
+            with self.subTest(processor=processor_class.__name__):
+                features.append(processor_class._default_features())
+                self.assertIs(processor_class._default_features(), features[-1])
+        self.assertNotEqual(features[0], features[1])
+
+    def test_default_analysis_levels_are_not_shared(self) -> None:
+        for processor_class in _PROCESSORS_WITH_DEFAULT_FEATURES:
+            with self.subTest(processor=processor_class.__name__):
+                processor = processor_class()
+                levels = processor.default_analysis_levels()
+                levels[0].features.clear()
+                levels[0].metric_configs.clear()
+                new_levels = processor.default_analysis_levels()
+                self.assertNotEqual(new_levels[0].features, {})
+                self.assertNotEqual(new_levels[0].metric_configs, {})
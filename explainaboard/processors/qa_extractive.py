@@ -8,6 +8,8 @@ from typing import Any
 from explainaboard import TaskType
 from explainaboard.analysis import feature
 from explainaboard.analysis.analyses import Analysis, AnalysisLevel
+from explainaboard.analysis.case import AnalysisCase
+from explainaboard.analysis.feature import FeatureType
 from explainaboard.analysis.feature_funcs import (
     accumulate_vocab_from_samples,
     count_tokens,
@@ -21,6 +23,41 @@ from explainaboard.processors.processor import Processor
 from explainaboard.utils.typing_utils import unwrap
 
 
+def _get_context_length(
+    info: SysOutputInfo, x: dict[str, Any], c: AnalysisCase
+) -> float:
+    return count_tokens(info, x['context'])
+
+
+def _get_question_length(
+    info: SysOutputInfo, x: dict[str, Any], c: AnalysisCase
+) -> float:
+    return count_tokens(info, x['question'])
+
+
+def _get_answer_length(
+    info: SysOutputInfo, x: dict[str, Any], c: AnalysisCase
+) -> float:
+    # The loader gives a list of answers, but a single string is also accepted for
+    # system outputs passed to the processor directly.
+    text = x['answers']['text']
+    return count_tokens(
+        info, text[0] if isinstance(text, list) else text, side='target'
+    )
+
+
+def _get_num_oov(
+    info: SysOutputInfo, x: dict[str, Any], c: AnalysisCase, stat: dict[str, Any]
+) -> float:
+    return feat_num_oov(info, x['context'], stat['source_vocab'])
+
+
+def _get_fre_rank(
+    info: SysOutputInfo, x: dict[str, Any], c: AnalysisCase, stat: dict[str, Any]
+) -> float:
+    return feat_freq_rank(info, x['context'], stat['source_vocab_rank'])
+
+
 class QAExtractiveProcessor(Processor):
     """A processor for the extractive QA task."""
 
@@ -29,9 +66,10 @@ class QAExtractiveProcessor(Processor):
         """See Processor.task_type."""
         return TaskType.qa_extractive
 
-    def default_analysis_levels(self) -> list[AnalysisLevel]:
-        """See Processor.default_analysis_levels."""
-        features = {
+    @classmethod
+    def _create_default_features(cls) -> dict[str, FeatureType]:
+        """See Processor._create_default_features."""
+        return {
             "context": feature.Value(dtype=feature.DataType.STRING),
             "question": feature.Value(dtype=feature.DataType.STRING),
             "id": feature.Value(dtype=feature.DataType.STRING),
@@ -42,31 +80,23 @@ class QAExtractiveProcessor(Processor):
             "context_length": feature.Value(
                 dtype=feature.DataType.FLOAT,
                 description="context length in tokens",
-                func=lambda info, x, c: count_tokens(info, x['context']),
+                func=_get_context_length,
             ),
             "question_length": feature.Value(
                 dtype=feature.DataType.FLOAT,
                 description="context length in tokens",
-                func=lambda info, x, c: count_tokens(info, x['question']),
+                func=_get_question_length,
             ),
             "answer_length": feature.Value(
                 dtype=feature.DataType.FLOAT,
                 description="context length in tokens",
-                func=lambda info, x, c: count_tokens(
-                    info,
-                    x['answers']['text'][0]
-                    if isinstance(x["answers"]["text"], list)
-                    else x['answers']['text'],
-                    side='target',
-                ),
+                func=_get_answer_length,
             ),
             "num_oov": feature.Value(
                 dtype=feature.DataType.FLOAT,
                 description="the number of out-of-vocabulary words in the context",
                 require_training_set=True,
-                func=lambda info, x, c, stat: feat_num_oov(
-                    info, x['context'], stat['source_vocab']
-                ),
+                func=_get_num_oov,
             ),
             "fre_rank": feature.Value(
                 dtype=feature.DataType.FLOAT,
@@ -74,16 +104,16 @@ class QAExtractiveProcessor(Processor):
                     "average rank of context words based on training set freq"
                 ),
                 require_training_set=True,
-                func=lambda info, x, c, stat: feat_freq_rank(
-                    info, x['context'], stat['source_vocab_rank']
-                ),
+                func=_get_fre_rank,
             ),
         }
 
+    def default_analysis_levels(self) -> list[AnalysisLevel]:
+        """See Processor.default_analysis_levels."""
         return [
             AnalysisLevel(
                 name='example',
-                features=features,
+                features=dict(self._default_features()),
                 metric_configs=self.default_metrics(),
             )
         ]
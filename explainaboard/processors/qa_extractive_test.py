@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import unittest
 
+from explainaboard.analysis.case import AnalysisCase
 from explainaboard.constants import TaskType
+from explainaboard.info import SysOutputInfo
 from explainaboard.processors.processor_factory import get_processor_class
 from explainaboard.processors.qa_extractive import QAExtractiveProcessor
+from explainaboard.utils.tokenizer import SingleSpaceTokenizer
+from explainaboard.utils.typing_utils import unwrap
 
 
 class QAExtractiveProcessorTest(unittest.TestCase):
@@ -14,3 +18,56 @@ class QAExtractiveProcessorTest(unittest.TestCase):
         self.assertIs(
             get_processor_class(TaskType.qa_extractive), QAExtractiveProcessor
         )
+
+    def test_length_features(self) -> None:
+        features = QAExtractiveProcessor._default_features()
+        info = SysOutputInfo(
+            task_name="test",
+            source_tokenizer=SingleSpaceTokenizer(),
+            target_tokenizer=SingleSpaceTokenizer(),
+        )
+        case = AnalysisCase(sample_id=0, features={})
+        example = {
+            "context": "a b c d",
+            "question": "a b",
+            "answers": {"text": ["c d e", "c"]},
+        }
+        self.assertEqual(
+            unwrap(features["context_length"].func)(info, example, case), 4
+        )
+        self.assertEqual(
+            unwrap(features["question_length"].func)(info, example, case), 2
+        )
+        self.assertEqual(unwrap(features["answer_length"].func)(info, example, case), 3)
+        example["answers"] = {"text": "c"}
+        self.assertEqual(unwrap(features["answer_length"].func)(info, example, case), 1)
+
+    def test_context_is_tokenized_once(self) -> None:
+        # context_length, num_oov and fre_rank share the tokenization of the context
+        # through the cache of the tokenizer.
+        processor = QAExtractiveProcessor()
+        tokenizer = SingleSpaceTokenizer()
+        info = SysOutputInfo(
+            task_name="test", source_tokenizer=tokenizer, target_tokenizer=tokenizer
+        )
+        sys_output = [
+            {
+                "id": str(i),
+                "context": f"context {i}",
+                "question": f"question {i}",
+                "answers": {"text": [f"answer {i}"]},
+                "predicted_answers": {"text": f"answer {i}"},
+            }
+            for i in range(5)
+        ]
+        level = processor.default_analysis_levels()[0]
+        level.metric_configs.clear()
+        statistics = processor._statistics_func(sys_output, info)
+
+        SingleSpaceTokenizer.__call__.cache_clear()
+        processor._gen_cases_and_stats(info, sys_output, statistics, level)
+        cache_info = SingleSpaceTokenizer.__call__.cache_info()
+        # One tokenization each for the context, question and answer.
+        self.assertEqual(cache_info.misses, 3 * len(sys_output))
+        # num_oov and fre_rank reuse the tokens of the context.
+        self.assertEqual(cache_info.hits, 2 * len(sys_output))
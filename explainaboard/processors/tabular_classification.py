@@ -29,9 +29,10 @@ class TabularClassificationProcessor(Processor):
         """See Processor.task_type."""
         return TaskType.tabular_classification
 
-    def default_analysis_levels(self) -> list[AnalysisLevel]:
-        """See Processor.default_analysis_levels."""
-        features: dict[str, FeatureType] = {
+    @classmethod
+    def _create_default_features(cls) -> dict[str, FeatureType]:
+        """See Processor._create_default_features."""
+        return {
             "true_label": feature.Value(
                 dtype=feature.DataType.STRING,
                 description="the true label of the input",
@@ -49,17 +50,19 @@ class TabularClassificationProcessor(Processor):
             ),
         }
 
+    def default_analysis_levels(self) -> list[AnalysisLevel]:
+        """See Processor.default_analysis_levels."""
         return [
             AnalysisLevel(
                 name='example',
-                features=features,
+                features=dict(self._default_features()),
                 metric_configs=self.default_metrics(),
             )
         ]
 
     def default_analyses(self) -> list[Analysis]:
         """See Processor.default_analyses."""
-        features = self.default_analysis_levels()[0].features
+        features = self._default_features()
         # Create analyses
         analyses: list[Analysis] = [
             BucketAnalysis(
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import unittest
 
+from explainaboard.analysis import feature
+from explainaboard.analysis.analyses import AnalysisLevel
 from explainaboard.constants import TaskType
+from explainaboard.info import SysOutputInfo
 from explainaboard.processors.processor_factory import get_processor_class
 from explainaboard.processors.text_classification import TextClassificationProcessor
 
@@ -15,3 +18,35 @@ class TextClassificationProcessorTest(unittest.TestCase):
             get_processor_class(TaskType.text_classification),
             TextClassificationProcessor,
         )
+
+    def test_gen_cases_and_stats(self) -> None:
+        processor = TextClassificationProcessor()
+        level = AnalysisLevel(
+            name="example",
+            features={
+                "text": feature.Value(dtype=feature.DataType.STRING),
+                "missing": feature.Value(dtype=feature.DataType.STRING, optional=True),
+                "text_length": feature.Value(
+                    dtype=feature.DataType.FLOAT,
+                    func=lambda info, x, c: len(x["text"]),
+                ),
+                "num_oov": feature.Value(
+                    dtype=feature.DataType.FLOAT,
+                    require_training_set=True,
+                    func=lambda info, x, c, stat: stat["num_oov"],
+                ),
+            },
+            metric_configs={},
+        )
+        sys_info = SysOutputInfo(task_name="test")
+        sys_output = [{"text": "abc", "true_label": "a", "predicted_label": "b"}]
+
+        cases, _ = processor._gen_cases_and_stats(sys_info, sys_output, None, level)
+        self.assertEqual(cases[0].features, {"text": "abc", "text_length": 3})
+
+        cases, _ = processor._gen_cases_and_stats(
+            sys_info, sys_output, {"num_oov": 2}, level
+        )
+        self.assertEqual(
+            cases[0].features, {"text": "abc", "text_length": 3, "num_oov": 2}
+        )
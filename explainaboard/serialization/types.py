@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import abc
 import dataclasses
+import functools
 from typing import Dict, final, List, Tuple, Union
 
 # TODO(odashi):
@@ -74,6 +75,16 @@ class Serializable(metaclass=abc.ABCMeta):
         ...
 
 
+# Types of member values which SerializableDataclass.serialize() passes through as-is.
+_PRIMITIVE_TYPES = (type(None), bool, int, float, str)
+
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_field_names(cls: type) -> tuple[str, ...]:
+    """Returns the names of all fields of the given dataclass."""
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
 class SerializableDataclass(Serializable):
     """Mix-in class of serializable dataclass.
 
@@ -97,7 +108,21 @@ class SerializableDataclass(Serializable):
         """See Serializable.serialize."""
         if not dataclasses.is_dataclass(self):
             raise TypeError(f"{self.__class__.__name__} is not a dataclass.")
-        return dataclasses.asdict(self)
+
+        # Most dataclasses have only primitive members, or lists of them. They are
+        # converted here without the recursive deepcopy of dataclasses.asdict().
+        data: dict[str, SerializableData] = {}
+        for name in _dataclass_field_names(type(self)):
+            value = getattr(self, name)
+            if isinstance(value, _PRIMITIVE_TYPES):
+                data[name] = value
+            elif type(value) in (list, tuple) and all(
+                isinstance(x, _PRIMITIVE_TYPES) for x in value
+            ):
+                data[name] = type(value)(value)
+            else:
+                return dataclasses.asdict(self)
+        return data
 
     @final
     @classmethod
@@ -107,5 +132,5 @@ class SerializableDataclass(Serializable):
             raise TypeError(f"{cls.__name__} is not a dataclass.")
 
         # This function does not process runtime type checking for now.
-        field_names = set(field.name for field in dataclasses.fields(cls))
+        field_names = _dataclass_field_names(cls)
         return cls(**{k: v for k, v in data.items() if k in field_names})
@@ -1,5 +1,7 @@
 """Tests for explainaboard.serialization.types."""
 
+from __future__ import annotations
+
 import dataclasses
 import unittest
 
@@ -14,6 +16,20 @@ class MyData(SerializableDataclass):
     bar: str
 
 
+@dataclasses.dataclass
+class ListData(SerializableDataclass):
+    """SerializableDataclass with a list member for this test."""
+
+    items: list[str]
+
+
+@dataclasses.dataclass
+class NestedData(SerializableDataclass):
+    """SerializableDataclass with a nested dataclass for this test."""
+
+    data: MyData
+
+
 class WithoutDecorator(SerializableDataclass):
     """SerializableDataclass without decorator."""
 
@@ -24,6 +40,20 @@ class SerializableDataclassTest(unittest.TestCase):
     def test_serialize(self) -> None:
         self.assertEqual(MyData(111, "222").serialize(), {"foo": 111, "bar": "222"})
 
+    def test_serialize_list(self) -> None:
+        data = ListData(["a", "b"])
+        serialized = data.serialize()
+        self.assertEqual(serialized, {"items": ["a", "b"]})
+        # The list is copied.
+        self.assertIsNot(serialized["items"], data.items)
+
+    def test_serialize_nested(self) -> None:
+        # Nested dataclasses are converted to dicts as dataclasses.asdict() does.
+        self.assertEqual(
+            NestedData(MyData(111, "222")).serialize(),
+            {"data": {"foo": 111, "bar": "222"}},
+        )
+
     def test_serialize_without_decorator(self) -> None:
         with self.assertRaisesRegex(TypeError, r"is not a dataclass"):
             WithoutDecorator().serialize()
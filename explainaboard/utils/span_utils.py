@@ -574,11 +574,57 @@ class BIOSpanOps(SpanOps):
 
     _DEFAULT = 'O'
 
+    def __init__(
+        self, resources: dict[str, Any] | None = None, match_type: Optional[str] = None
+    ):
+        """See SpanOps.__init__."""
+        super().__init__(resources=resources, match_type=match_type)
+        # Cache of tag -> (whether it is a "B" tag, whether it is an "I" tag, span type)
+        # used by get_spans_simple. Tag sets are small, so each tag is parsed only once.
+        self._tag_table: dict[str, tuple[bool, bool, str | None]] = {}
+
     @classmethod
     def default_match_type(cls) -> str:
         """See SpanOps.default_match_type."""
         return "position_tag"
 
+    def _parse_tag(self, tag: str) -> tuple[bool, bool, str | None]:
+        is_begin = tag.startswith('B')
+        is_inside = tag.startswith('I')
+        span_type = tag.split('-')[1] if is_begin or is_inside else None
+        parsed = self._tag_table[tag] = (is_begin, is_inside, span_type)
+        return parsed
+
+    def get_spans_simple(self, tags: list[str]) -> list[tuple[str, int, int]]:
+        """See SpanOps.get_spans_simple.
+
+        This applies the rules of `_span_ends`, `_span_starts` and `_span_type` inline
+        since this is called for every sequence to calculate SeqF1Score. The result is
+        the same as the generic implementation for tags that are "O", B- or I- tags.
+        Any other tag ends the current span without starting a new one.
+        """
+        tag_table = self._tag_table
+        spans = []
+        span_start = -1
+        span_type = ''
+        prev_tag = self._DEFAULT
+        for i, tag in enumerate(tags):
+            parsed = tag_table.get(tag)
+            if parsed is None:
+                parsed = self._parse_tag(tag)
+            is_begin, is_inside, tag_type = parsed
+            if span_start != -1 and not is_inside:
+                spans.append((span_type, span_start, i))
+                span_start = -1
+            if is_begin or (is_inside and prev_tag == self._DEFAULT):
+                span_start = i
+                span_type = cast(str, tag_type)
+            prev_tag = tag
+        # end condition
+        if span_start != -1:
+            spans.append((span_type, span_start, len(tags)))
+        return spans
+
     def _span_ends(self, tags: list[str], i: int) -> bool:
         return i != 0 and tags[i - 1] != self._DEFAULT and not tags[i].startswith('I')
 
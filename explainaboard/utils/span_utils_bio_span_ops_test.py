@@ -18,6 +18,34 @@ class BIOSpanOpsTest(unittest.TestCase):
         self.assertEqual(span_text_list, ['New York', 'Beijing'])
         self.assertEqual(span_tag_list, ['LOC', 'LOC'])
 
+    def test_get_spans_simple(self):
+        tags = ["I-PER", "O", "B-LOC", "I-LOC", "B-ORG", "I-LOC", "O", "I-MISC"]
+        self.assertEqual(
+            BIOSpanOps().get_spans_simple(tags),
+            [("PER", 0, 1), ("LOC", 2, 4), ("ORG", 4, 6), ("MISC", 7, 8)],
+        )
+        self.assertEqual(BIOSpanOps().get_spans_simple([]), [])
+
+    def test_get_spans_simple_reuse(self):
+        # Parsed tags are cached by the object, so results must not depend on the
+        # sequences seen before.
+        span_ops = BIOSpanOps()
+        self.assertEqual(
+            span_ops.get_spans_simple(["B-PER", "I-PER", "O"]), [("PER", 0, 2)]
+        )
+        self.assertEqual(
+            span_ops.get_spans_simple(["I-PER", "B-PER", "B-LOC"]),
+            [("PER", 0, 1), ("PER", 1, 2), ("LOC", 2, 3)],
+        )
+
+    def test_get_spans_simple_malformed_tags(self):
+        span_ops = BIOSpanOps()
+        self.assertEqual(
+            span_ops.get_spans_simple(["B-PER", "X", "O"]), [("PER", 0, 1)]
+        )
+        self.assertEqual(span_ops.get_spans_simple(["X", "B-PER"]), [("PER", 1, 2)])
+        self.assertEqual(span_ops.get_spans_simple(["X", "I-PER", "O"]), [])
+
     def test_get_matched_spans(self):
 
         # Span a